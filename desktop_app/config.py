@@ -13,10 +13,12 @@ ASSETS_DIR = BASE_DIR / "assets"
 
 # Database
 DATABASE_PATH = DATA_DIR / "tickets.db"
-DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+DATABASE_PATH_STR = str(DATABASE_PATH)
+DATABASE_URL = f"sqlite:///{DATABASE_PATH_STR}"
 
 # Face data storage
 FACES_DIR = DATA_DIR / "faces"
+FACE_CACHE_FILE = FACES_DIR / "encodings_cache.enc"  # Encrypted snapshot of all loaded encodings
 BOARDING_PASSES_DIR = DATA_DIR / "boarding_passes"
 
 # QR Code storage
@@ -106,14 +108,21 @@ THEME = {
 }
 
 # Ensure directories exist
+# String forms are computed once so init_directories() skips pathlib entirely
+_DIRS = tuple(str(d) for d in (
+    DATA_DIR, FACES_DIR, BOARDING_PASSES_DIR, QR_CODES_DIR, LOGS_DIR,
+    REPORTS_DIR, ASSETS_DIR, SOUNDS_DIR, LOCALES_DIR
+))
+_DIRS_READY = False
+
+
 def init_directories():
-    """Create required directories if they don't exist."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    FACES_DIR.mkdir(parents=True, exist_ok=True)
-    BOARDING_PASSES_DIR.mkdir(parents=True, exist_ok=True)
-    QR_CODES_DIR.mkdir(parents=True, exist_ok=True)
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
-    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
-    SOUNDS_DIR.mkdir(parents=True, exist_ok=True)
-    LOCALES_DIR.mkdir(parents=True, exist_ok=True)
+    """Create required directories if they don't exist (only once per process)."""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    
+    for directory in _DIRS:
+        os.makedirs(directory, exist_ok=True)
+    
+    _DIRS_READY = True
@@ -3,16 +3,58 @@ Database Manager for Flight Ticketing Kiosk System
 Handles database connections, sessions, and CRUD operations.
 """
 import random
+import secrets
 import string
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from contextlib import contextmanager
 from typing import Optional, List
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import bindparam, create_engine, event, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 
 from config import DATABASE_URL, init_directories
-from database.models import Base, Passenger, Ticket, TicketStatus, create_tables
+from database.models import (
+    Base, Passenger, Ticket, STATUS_BOOKED, STATUS_CHECKED_IN, STATUS_CANCELLED, create_tables
+)
+
+_TICKET_ALPHABET = string.ascii_uppercase + string.digits
+
+# All possible seats (rows 1-30, A-F) and gates (terminals A-D, 1-20)
+_SEATS = [f"{row}{seat}" for row in range(1, 31) for seat in "ABCDEF"]
+_GATES = [f"{terminal}{num}" for terminal in "ABCD" for num in range(1, 21)]
+
+# Column sets for list queries - plain Rows avoid ORM instance overhead.
+# full_name is computed in SQL so rows can stand in for Passenger objects.
+_PASSENGER_NAME = Passenger.first_name + " " + Passenger.last_name
+_TICKET_COLUMNS = tuple(Ticket.__table__.columns)
+_PASSENGER_COLUMNS = (*Passenger.__table__.columns, _PASSENGER_NAME.label("full_name"))
+
+# Read statements are built once and reused; per-call values go in as bind
+# parameters so only the parameters change between executions
+_PASSENGER_BY_PASSPORT = select(Passenger).where(
+    Passenger.passport_number == bindparam("passport_number")
+)
+_ALL_PASSENGERS = select(*_PASSENGER_COLUMNS)
+_TICKET_BY_NUMBER = select(Ticket).where(Ticket.ticket_number == bindparam("ticket_number"))
+_TICKETS_BY_PASSENGER = (
+    select(*_TICKET_COLUMNS)
+    .where(Ticket.passenger_id == bindparam("passenger_id"))
+    .order_by(Ticket.flight_date.desc())
+)
+_ALL_TICKETS = (
+    select(*_TICKET_COLUMNS, _PASSENGER_NAME.label("passenger_name"))
+    .outerjoin(Passenger, Ticket.passenger_id == Passenger.id)
+    .order_by(Ticket.created_at.desc())
+)
+_BOOKED_TICKETS = (
+    select(*_TICKET_COLUMNS)
+    .where(Ticket.status == STATUS_BOOKED)
+    .order_by(Ticket.flight_date)
+)
 
 
 class DatabaseManager:
@@ -21,22 +63,96 @@ class DatabaseManager:
     def __init__(self):
         """Initialize database connection."""
         init_directories()
-        self.engine = create_engine(DATABASE_URL, echo=False)
-        create_tables(self.engine)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        # Single writer connection: SQLite only allows one writer at a time anyway
+        self.writer_engine = create_engine(
+            DATABASE_URL,
+            echo=False,
+            poolclass=QueuePool,
+            pool_size=1,
+            max_overflow=0,
+            connect_args={"check_same_thread": False, "timeout": 30}
+        )
+        # Reader pool: WAL lets these run alongside the writer
+        self.reader_engine = create_engine(
+            DATABASE_URL,
+            echo=False,
+            poolclass=QueuePool,
+            pool_size=8,
+            max_overflow=4,
+            connect_args={"check_same_thread": False, "timeout": 30}
+        )
+        event.listen(self.writer_engine, "connect", self._set_sqlite_pragmas)
+        event.listen(self.writer_engine, "connect", self._disable_pysqlite_begin)
+        event.listen(self.writer_engine, "begin", self._begin_immediate)
+        event.listen(self.reader_engine, "connect", self._set_sqlite_pragmas)
+        
+        create_tables(self.writer_engine)
+        # Thread-local sessions so calls nested inside one another on the same
+        # thread share a single session (and pooled connection)
+        self.ReadSession = scoped_session(
+            sessionmaker(bind=self.reader_engine, expire_on_commit=False)
+        )
+        self.WriteSession = scoped_session(
+            sessionmaker(bind=self.writer_engine, expire_on_commit=False)
+        )
+        # Bumped after every committed write so views can tell if data changed
+        self.data_version = 0
+    
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_conn, connection_record):
+        """Tune each new SQLite connection (WAL lets readers run alongside the writer)."""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64MB
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+        cursor.close()
+    
+    @staticmethod
+    def _disable_pysqlite_begin(dbapi_conn, connection_record):
+        """Stop pysqlite from emitting its own deferred BEGIN."""
+        dbapi_conn.isolation_level = None
+    
+    @staticmethod
+    def _begin_immediate(conn):
+        """Take the write lock up front instead of failing later with SQLITE_BUSY."""
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    
+    @contextmanager
+    def get_read_session(self) -> Session:
+        """Context manager for read-only sessions on the reader pool."""
+        if self.ReadSession.registry.has():
+            # Already inside a read scope on this thread - reuse it
+            yield self.ReadSession()
+            return
+        session = self.ReadSession()
+        try:
+            yield session
+        finally:
+            self.ReadSession.remove()
     
     @contextmanager
-    def get_session(self) -> Session:
-        """Context manager for database sessions."""
-        session = self.SessionLocal()
+    def get_write_session(self) -> Session:
+        """
+        Context manager for sessions that modify data (single writer).
+        Nested calls on the same thread join the outermost session, which
+        owns the commit/rollback.
+        """
+        if self.WriteSession.registry.has():
+            yield self.WriteSession()
+            return
+        session = self.WriteSession()
         try:
             yield session
             session.commit()
+            self.data_version += 1
         except Exception as e:
             session.rollback()
             raise e
         finally:
-            session.close()
+            self.WriteSession.remove()
     
     # ==================== Passenger Operations ====================
     
@@ -47,51 +163,55 @@ class DatabaseManager:
         passport_number: str,
         face_file: Optional[str] = None
     ) -> Passenger:
-        """Create a new passenger."""
-        with self.get_session() as session:
-            passenger = Passenger(
-                first_name=first_name.strip(),
-                last_name=last_name.strip(),
-                passport_number=passport_number.strip().upper(),
-                face_file=face_file
+        """
+        Create a new passenger, or return the existing one with the same
+        passport (updating the name) in a single INSERT ... ON CONFLICT.
+        """
+        first_name = first_name.strip()
+        last_name = last_name.strip()
+        
+        with self.get_write_session() as session:
+            stmt = (
+                sqlite_insert(Passenger)
+                .values(
+                    first_name=first_name,
+                    last_name=last_name,
+                    passport_number=passport_number.strip().upper(),
+                    face_file=face_file
+                )
+                .on_conflict_do_update(
+                    index_elements=[Passenger.passport_number],
+                    set_={'first_name': first_name, 'last_name': last_name}
+                )
+                .returning(Passenger)
             )
-            session.add(passenger)
-            session.flush()
-            session.refresh(passenger)
-            # Detach from session to return
-            session.expunge(passenger)
-            return passenger
+            return session.execute(stmt).scalar_one()
     
     def get_passenger_by_id(self, passenger_id: int) -> Optional[Passenger]:
         """Get a passenger by ID."""
-        with self.get_session() as session:
-            passenger = session.query(Passenger).filter(Passenger.id == passenger_id).first()
+        with self.get_read_session() as session:
+            passenger = session.get(Passenger, passenger_id)
             if passenger:
                 session.expunge(passenger)
             return passenger
     
     def get_passenger_by_passport(self, passport_number: str) -> Optional[Passenger]:
         """Get a passenger by passport number."""
-        with self.get_session() as session:
-            passenger = session.query(Passenger).filter(
-                Passenger.passport_number == passport_number.strip().upper()
-            ).first()
-            if passenger:
-                session.expunge(passenger)
-            return passenger
+        with self.get_read_session() as session:
+            return session.execute(
+                _PASSENGER_BY_PASSPORT,
+                {"passport_number": passport_number.strip().upper()}
+            ).scalar_one_or_none()
     
-    def get_all_passengers(self) -> List[Passenger]:
-        """Get all passengers."""
-        with self.get_session() as session:
-            passengers = session.query(Passenger).all()
-            for p in passengers:
-                session.expunge(p)
-            return passengers
+    def get_all_passengers(self) -> List[Row]:
+        """Get all passengers as lightweight read-only rows."""
+        with self.get_read_session() as session:
+            return session.execute(_ALL_PASSENGERS).all()
     
     def update_passenger_face(self, passenger_id: int, face_file: str) -> bool:
         """Update passenger's face file path."""
-        with self.get_session() as session:
-            passenger = session.query(Passenger).filter(Passenger.id == passenger_id).first()
+        with self.get_write_session() as session:
+            passenger = session.get(Passenger, passenger_id)
             if passenger:
                 passenger.face_file = face_file
                 return True
@@ -102,23 +222,23 @@ class DatabaseManager:
     @staticmethod
     def generate_ticket_number() -> str:
         """Generate a unique ticket number like TK-A1B2C3."""
-        chars = string.ascii_uppercase + string.digits
-        code = ''.join(random.choices(chars, k=6))
-        return f"TK-{code}"
+        # One 32-bit draw covers 6 base-36 symbols (36**6 < 2**32)
+        n = secrets.randbits(32)
+        code = []
+        for _ in range(6):
+            n, r = divmod(n, 36)
+            code.append(_TICKET_ALPHABET[r])
+        return f"TK-{''.join(code)}"
     
     @staticmethod
     def generate_seat() -> str:
         """Generate a random seat number like 12A."""
-        row = random.randint(1, 30)
-        seat = random.choice(['A', 'B', 'C', 'D', 'E', 'F'])
-        return f"{row}{seat}"
+        return random.choice(_SEATS)
     
     @staticmethod
     def generate_gate() -> str:
         """Generate a random gate like B7."""
-        terminal = random.choice(['A', 'B', 'C', 'D'])
-        gate_num = random.randint(1, 20)
-        return f"{terminal}{gate_num}"
+        return random.choice(_GATES)
     
     def create_ticket(
         self,
@@ -131,7 +251,7 @@ class DatabaseManager:
         flight_time
     ) -> Ticket:
         """Create a new ticket for a passenger."""
-        with self.get_session() as session:
+        with self.get_write_session() as session:
             ticket = Ticket(
                 ticket_number=self.generate_ticket_number(),
                 passenger_id=passenger_id,
@@ -141,90 +261,99 @@ class DatabaseManager:
                 destination_airport_name=destination_airport_name,
                 flight_date=flight_date,
                 flight_time=flight_time,
-                status=TicketStatus.BOOKED
+                status=STATUS_BOOKED
             )
             session.add(ticket)
             session.flush()
-            session.refresh(ticket)
-            session.expunge(ticket)
             return ticket
     
+    def bulk_create_tickets(self, records: List[dict]) -> int:
+        """
+        Create many tickets in one transaction (seed/import flows).
+        Each record takes the same keys as create_ticket; a ticket number is
+        generated for records that don't supply one.
+        Returns the number of tickets created.
+        """
+        if not records:
+            return 0
+        
+        rows = []
+        for record in records:
+            row = dict(record)
+            row.setdefault('ticket_number', self.generate_ticket_number())
+            row['source_airport'] = row['source_airport'].upper()
+            row['destination_airport'] = row['destination_airport'].upper()
+            row.setdefault('status', STATUS_BOOKED)
+            rows.append(row)
+        
+        with self.get_write_session() as session:
+            session.execute(insert(Ticket), rows)
+        return len(rows)
+    
     def get_ticket_by_id(self, ticket_id: int) -> Optional[Ticket]:
         """Get a ticket by ID."""
-        with self.get_session() as session:
-            ticket = session.query(Ticket).filter(Ticket.id == ticket_id).first()
+        with self.get_read_session() as session:
+            ticket = session.get(Ticket, ticket_id)
             if ticket:
                 session.expunge(ticket)
             return ticket
     
     def get_ticket_by_number(self, ticket_number: str) -> Optional[Ticket]:
         """Get a ticket by ticket number."""
-        with self.get_session() as session:
-            ticket = session.query(Ticket).filter(
-                Ticket.ticket_number == ticket_number.strip().upper()
-            ).first()
-            if ticket:
-                session.expunge(ticket)
-            return ticket
+        with self.get_read_session() as session:
+            return session.execute(
+                _TICKET_BY_NUMBER,
+                {"ticket_number": ticket_number.strip().upper()}
+            ).scalar_one_or_none()
     
-    def get_tickets_by_passenger(self, passenger_id: int) -> List[Ticket]:
-        """Get all tickets for a passenger."""
-        with self.get_session() as session:
-            tickets = session.query(Ticket).filter(
-                Ticket.passenger_id == passenger_id
-            ).order_by(Ticket.flight_date.desc()).all()
-            for t in tickets:
-                session.expunge(t)
-            return tickets
+    def get_tickets_by_passenger(self, passenger_id: int) -> List[Row]:
+        """Get all tickets for a passenger as lightweight read-only rows."""
+        with self.get_read_session() as session:
+            return session.execute(
+                _TICKETS_BY_PASSENGER, {"passenger_id": passenger_id}
+            ).all()
     
-    def get_all_tickets(self) -> List[Ticket]:
-        """Get all tickets with passenger info."""
-        with self.get_session() as session:
-            tickets = session.query(Ticket).order_by(Ticket.created_at.desc()).all()
-            for t in tickets:
-                session.expunge(t)
-            return tickets
+    def get_all_tickets(self) -> List[Row]:
+        """
+        Get all tickets with passenger info as lightweight read-only rows.
+        The passenger's name is joined in (passenger_name) so list views
+        don't need a lookup per ticket.
+        """
+        with self.get_read_session() as session:
+            return session.execute(_ALL_TICKETS).all()
     
-    def get_booked_tickets(self) -> List[Ticket]:
+    def get_booked_tickets(self) -> List[Row]:
         """Get all tickets that are booked but not checked in."""
-        with self.get_session() as session:
-            tickets = session.query(Ticket).filter(
-                Ticket.status == TicketStatus.BOOKED
-            ).order_by(Ticket.flight_date).all()
-            for t in tickets:
-                session.expunge(t)
-            return tickets
+        with self.get_read_session() as session:
+            return session.execute(_BOOKED_TICKETS).all()
     
     def check_in_ticket(self, ticket_id: int) -> Optional[Ticket]:
         """Check in a ticket - generate seat, gate, update status."""
-        with self.get_session() as session:
-            ticket = session.query(Ticket).filter(Ticket.id == ticket_id).first()
-            if ticket and ticket.status == TicketStatus.BOOKED:
+        with self.get_write_session() as session:
+            ticket = session.get(Ticket, ticket_id)
+            if ticket and ticket.status == STATUS_BOOKED:
                 ticket.seat_number = self.generate_seat()
                 ticket.gate = self.generate_gate()
-                ticket.status = TicketStatus.CHECKED_IN
+                ticket.status = STATUS_CHECKED_IN
                 ticket.checked_in_at = datetime.utcnow()
-                session.flush()
-                session.refresh(ticket)
-                session.expunge(ticket)
                 return ticket
             return None
     
     def cancel_ticket(self, ticket_id: int) -> bool:
         """Cancel a ticket."""
-        with self.get_session() as session:
-            ticket = session.query(Ticket).filter(Ticket.id == ticket_id).first()
-            if ticket and ticket.status != TicketStatus.CANCELLED:
-                ticket.status = TicketStatus.CANCELLED
+        with self.get_write_session() as session:
+            ticket = session.get(Ticket, ticket_id)
+            if ticket and ticket.status != STATUS_CANCELLED:
+                ticket.status = STATUS_CANCELLED
                 return True
             return False
     
     def reset_ticket_checkin(self, ticket_id: int) -> bool:
         """Reset a ticket's check-in status (admin function)."""
-        with self.get_session() as session:
-            ticket = session.query(Ticket).filter(Ticket.id == ticket_id).first()
-            if ticket and ticket.status == TicketStatus.CHECKED_IN:
-                ticket.status = TicketStatus.BOOKED
+        with self.get_write_session() as session:
+            ticket = session.get(Ticket, ticket_id)
+            if ticket and ticket.status == STATUS_CHECKED_IN:
+                ticket.status = STATUS_BOOKED
                 ticket.seat_number = None
                 ticket.gate = None
                 ticket.checked_in_at = None
@@ -233,8 +362,8 @@ class DatabaseManager:
     
     def delete_passenger(self, passenger_id: int) -> bool:
         """Delete a passenger and all their tickets (cascade)."""
-        with self.get_session() as session:
-            passenger = session.query(Passenger).filter(Passenger.id == passenger_id).first()
+        with self.get_write_session() as session:
+            passenger = session.get(Passenger, passenger_id)
             if passenger:
                 session.delete(passenger)
                 return True
@@ -245,25 +374,48 @@ class DatabaseManager:
         Reset tickets that were checked in more than 24 hours ago.
         Returns the number of tickets reset.
         """
-        from datetime import timedelta
         cutoff = datetime.utcnow() - timedelta(hours=24)
         
-        with self.get_session() as session:
-            old_tickets = session.query(Ticket).filter(
-                Ticket.status == TicketStatus.CHECKED_IN,
-                Ticket.checked_in_at <= cutoff
-            ).all()
-            
-            count = 0
-            for ticket in old_tickets:
-                ticket.status = TicketStatus.BOOKED
-                ticket.seat_number = None
-                ticket.gate = None
-                ticket.checked_in_at = None
-                count += 1
-            
-            return count
+        with self.get_write_session() as session:
+            # Single UPDATE statement instead of loading and mutating each row
+            result = session.execute(
+                update(Ticket)
+                .where(
+                    Ticket.status == STATUS_CHECKED_IN,
+                    Ticket.checked_in_at <= cutoff
+                )
+                .values(
+                    status=STATUS_BOOKED,
+                    seat_number=None,
+                    gate=None,
+                    checked_in_at=None
+                )
+                .execution_options(synchronize_session=False)
+            )
+            return result.rowcount
+
+
+# Global database instance - created on first use so importing this module
+# doesn't open the database or run DDL
+_db: Optional[DatabaseManager] = None
+_db_lock = threading.Lock()
+
+
+def get_db() -> DatabaseManager:
+    """Return the shared DatabaseManager, creating it on first call."""
+    global _db
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                _db = DatabaseManager()
+    return _db
+
+
+class _LazyDatabase:
+    """Forwards attribute access to the shared DatabaseManager."""
+    
+    def __getattr__(self, name):
+        return getattr(get_db(), name)
 
 
-# Global database instance
-db = DatabaseManager()
+db = _LazyDatabase()
@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from sqlalchemy import (
     Column, Integer, String, DateTime, Date, Time, 
-    ForeignKey, Enum, create_engine
+    ForeignKey, Index, CheckConstraint, create_engine
 )
 from sqlalchemy.orm import relationship, declarative_base
 
@@ -19,6 +19,13 @@ class TicketStatus(PyEnum):
     CANCELLED = "cancelled"
 
 
+# Ticket status as stored in the database (plain strings - no per-row enum
+# conversion when loading lists of tickets)
+STATUS_BOOKED = TicketStatus.BOOKED.value
+STATUS_CHECKED_IN = TicketStatus.CHECKED_IN.value
+STATUS_CANCELLED = TicketStatus.CANCELLED.value
+
+
 class Passenger(Base):
     """Passenger model - stores passenger information and face data reference."""
     __tablename__ = "passengers"
@@ -45,6 +52,17 @@ class Passenger(Base):
 class Ticket(Base):
     """Ticket model - stores flight booking information."""
     __tablename__ = "tickets"
+    __table_args__ = (
+        # Composite indexes for the hot lookups (ticket_number is already
+        # covered by its unique constraint)
+        Index("ix_tickets_passenger_flightdate", "passenger_id", "flight_date"),
+        Index("ix_tickets_status_flightdate", "status", "flight_date"),
+        Index("ix_tickets_status_checkedin", "status", "checked_in_at"),
+        CheckConstraint(
+            "status IN ('booked', 'checked_in', 'cancelled')",
+            name="ck_tickets_status"
+        ),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     ticket_number = Column(String(10), unique=True, nullable=False)  # e.g., "TK-A1B2C3"
@@ -64,7 +82,7 @@ class Ticket(Base):
     gate = Column(String(5), nullable=True)          # e.g., "B7"
     
     # Status tracking
-    status = Column(Enum(TicketStatus), default=TicketStatus.BOOKED)
+    status = Column(String(16), nullable=False, default=STATUS_BOOKED)
     checked_in_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -72,9 +90,29 @@ class Ticket(Base):
     passenger = relationship("Passenger", back_populates="tickets")
     
     def __repr__(self):
-        return f"<Ticket(number='{self.ticket_number}', {self.source_airport}->{self.destination_airport}, status={self.status.value})>"
+        return f"<Ticket(number='{self.ticket_number}', {self.source_airport}->{self.destination_airport}, status={self.status})>"
 
 
 def create_tables(engine):
-    """Create all tables in the database."""
+    """Create all tables and indexes in the database (idempotent)."""
     Base.metadata.create_all(engine)
+    
+    # create_all skips existing tables, so add any indexes that were
+    # introduced after the database was first created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    
+    # Gather planner statistics once so SQLite actually picks the indexes
+    with engine.begin() as conn:
+        has_stats = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).first()
+        if not has_stats:
+            conn.exec_driver_sql("ANALYZE")
+        
+        # Older databases stored the enum names ('BOOKED') rather than values
+        conn.exec_driver_sql(
+            "UPDATE tickets SET status = lower(status) "
+            "WHERE status IN ('BOOKED', 'CHECKED_IN', 'CANCELLED')"
+        )
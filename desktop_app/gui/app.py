@@ -3,15 +3,17 @@ Main Application Window - Flight Kiosk System.
 Modern dark-themed interface with sidebar navigation.
 Features: Theme toggle, session timeout, keyboard shortcuts.
 """
+import importlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import monotonic  # never jumps with wall-clock changes
 import customtkinter as ctk
 import logging
 
-from gui.theme import COLORS, FONTS, RADIUS, SPACING, apply_theme, toggle_theme, get_theme_mode, set_theme_mode
-from gui.booking_view import BookingView
-from gui.checkin_view import CheckInView
-from gui.history_view import HistoryView
-from gui.dashboard_view import DashboardView
-from gui.stats_view import StatsView
+from gui.theme import (
+    COLORS, FONTS, RADIUS, SPACING, apply_theme, init_fonts, toggle_theme, get_theme_mode, set_theme_mode
+)
 from config import SESSION_TIMEOUT_SECONDS
 from services.audit_service import audit_service
 from services.esp_service import esp_service
@@ -20,6 +22,15 @@ from database.db_manager import db
 
 logger = logging.getLogger(__name__)
 
+# Views are imported on first use - they pull in OpenCV, face_recognition, etc.
+VIEW_FACTORIES = {
+    "booking": ("gui.booking_view", "BookingView"),
+    "checkin": ("gui.checkin_view", "CheckInView"),
+    "history": ("gui.history_view", "HistoryView"),
+    "dashboard": ("gui.dashboard_view", "DashboardView"),
+    "stats": ("gui.stats_view", "StatsView"),
+}
+
 
 class App(ctk.CTk):
     """
@@ -40,16 +51,25 @@ class App(ctk.CTk):
         
         # Apply theme
         apply_theme(ctk)
+        init_fonts(ctk)
         self.configure(fg_color=COLORS['bg_primary'])
         
         # Current view tracking
         self.current_view = None
+        self._active_nav_key = None
         self.views = {}
+        self._view_cache_keys = {}  # view_key -> state signature at last on_show
+        self._scrollable_for_view = {}  # view_key -> its outermost scrollable frame
+        self._overlay_scrollable = None
+        self._overlay_cache = {}  # component class -> reusable instance
+        self._overlay_component = None
+        self._overlay_visible = False
         
         # Session timeout tracking
         self._last_activity = 0
         self._timeout_warning_shown = False
         self._timeout_job = None
+        self._last_event_time = 0  # Tk event timestamp (ms) of last recorded input
         
         self._setup_ui()
         self._create_top_controls()
@@ -57,15 +77,11 @@ class App(ctk.CTk):
         self._bind_mouse_scroll()
         self._start_activity_tracking()
         
-        # Cleanup old check-ins on startup
-        try:
-            reset_count = db.cleanup_old_checkins()
-            if reset_count > 0:
-                print(f"[*] Post-startup cleanup: Reset {reset_count} expired check-ins.")
-        except Exception as e:
-            print(f"[!] Startup cleanup failed: {e}")
-            
-        # Schedule periodic cleanup (every 6 hours)
+        # Blocking work (DB maintenance, ESP32 scan) runs here, off the UI thread
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="kiosk-bg")
+        
+        # Cleanup old check-ins now and every 6 hours
+        self._cleanup_inflight = False
         self._schedule_checkin_cleanup()
         
         # ESP32 Setup
@@ -73,30 +89,77 @@ class App(ctk.CTk):
         
         self._show_view("booking")
 
+    def run_in_background(self, func, on_done=None, on_error=None):
+        """
+        Run a blocking call on the worker pool and deliver its result (or
+        exception) to on_done/on_error on the Tk main loop.
+        """
+        future = self._executor.submit(func)
+        future.add_done_callback(
+            lambda f: self.after(0, self._deliver_result, f, on_done, on_error)
+        )
+        return future
+
+    @staticmethod
+    def _deliver_result(future, on_done, on_error):
+        """Hand a finished background call back to its callbacks (main thread)."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            if on_error:
+                on_error(error)
+            else:
+                logger.error(f"Background task failed: {error}")
+        elif on_done:
+            on_done(future.result())
+
     def _schedule_checkin_cleanup(self):
         """Schedule the check-in cleanup to run periodically."""
-        try:
-            db.cleanup_old_checkins()
-        except Exception:
-            pass
+        # Skip this round if the previous cleanup is still running
+        if not self._cleanup_inflight:
+            self._cleanup_inflight = True
+            self.run_in_background(
+                db.cleanup_old_checkins,
+                on_done=self._on_checkin_cleanup_done,
+                on_error=self._on_checkin_cleanup_failed
+            )
         # Run every 6 hours (21,600,000 ms)
         self.after(21600000, self._schedule_checkin_cleanup)
+
+    def _on_checkin_cleanup_done(self, reset_count: int):
+        self._cleanup_inflight = False
+        if reset_count > 0:
+            print(f"[*] Cleanup: Reset {reset_count} expired check-ins.")
+
+    def _on_checkin_cleanup_failed(self, error: Exception):
+        self._cleanup_inflight = False
+        print(f"[!] Check-in cleanup failed: {error}")
     
     def _setup_esp_service(self):
         """Initialize ESP32 connection and callbacks."""
         # Update initial status
         self.update_esp_status(esp_service.is_connected)
         
-        # Register callback for future updates
-        esp_service.set_connection_callback(self.update_esp_status)
+        # Register callback for future updates (fired from ESP worker threads)
+        esp_service.set_connection_callback(self._on_esp_connection_change)
         
         # Attempt connection in background (to not block UI)
         self.after(1000, self._connect_esp)
+
+    def _on_esp_connection_change(self, connected: bool):
+        """Marshal ESP connection changes onto the Tk main loop."""
+        self.after(0, self.update_esp_status, connected)
+
     def _connect_esp(self):
-        """Attempt to connect to ESP32."""
+        """Attempt to connect to ESP32 without blocking the UI."""
         if not esp_service.is_connected:
             print("[*] Auto-connecting to ESP32...")
-            esp_service.auto_connect()
+            # The MQTT/serial scan can take seconds
+            self.run_in_background(
+                esp_service.auto_connect,
+                on_done=lambda _: self.update_esp_status(esp_service.is_connected)
+            )
             
     def _setup_ui(self):
         """Setup the main UI layout."""
@@ -120,22 +183,35 @@ class App(ctk.CTk):
             corner_radius=0
         )
         self.content.pack(side="right", fill="both", expand=True)
+        # Views are stacked in the same grid cell and brought forward with tkraise()
+        self.content.grid_rowconfigure(0, weight=1)
+        self.content.grid_columnconfigure(0, weight=1)
         
         # Overlay Container (High-priority z-index layer)
         self.overlay_container = ctk.CTkFrame(
             self,
-            fg_color="transparent", # Will be dimmed in show_overlay
+            fg_color="#07090d", # Dimmed backdrop (rgba not supported directly in CTk)
             corner_radius=0
         )
         # Initially hidden
         self.overlay_container.place_forget()
-        
-        # Initialize views
-        self.views["booking"] = BookingView(self.content, on_booking_complete=self._on_booking_complete)
-        self.views["checkin"] = CheckInView(self.content)
-        self.views["history"] = HistoryView(self.content)
-        self.views["dashboard"] = DashboardView(self.content)
-        self.views["stats"] = StatsView(self.content, show_overlay_callback=self.show_overlay)
+
+    def _get_view(self, view_key: str):
+        """Return the view for a key, importing and creating it on first use."""
+        view = self.views.get(view_key)
+        if view is None and view_key in VIEW_FACTORIES:
+            module_name, class_name = VIEW_FACTORIES[view_key]
+            view_class = getattr(importlib.import_module(module_name), class_name)
+            
+            if view_key == "booking":
+                view = view_class(self.content, on_booking_complete=self._on_booking_complete)
+            elif view_key == "stats":
+                view = view_class(self.content, show_overlay_callback=self.show_overlay)
+            else:
+                view = view_class(self.content)
+            view.grid(row=0, column=0, sticky="nsew")
+            self.views[view_key] = view
+        return view
 
     def _create_top_controls(self):
         """Create global controls like the close button."""
@@ -206,30 +282,37 @@ class App(ctk.CTk):
             ("stats", "📈", "Statistics", "F5"),
         ]
         
+        # Resolve theme values and widget classes once for the whole loop
+        CTkFrame, CTkButton, CTkLabel = ctk.CTkFrame, ctk.CTkButton, ctk.CTkLabel
+        f_button, f_caption = FONTS['button'], FONTS['caption']
+        c_hover, c_primary, c_muted = COLORS['bg_hover'], COLORS['text_primary'], COLORS['text_muted']
+        r_md, sp_xs = RADIUS['md'], SPACING['xs']
+        show_view = self._show_view
+        
         for key, icon, title, shortcut in nav_items:
-            btn_frame = ctk.CTkFrame(nav_frame, fg_color="transparent")
-            btn_frame.pack(fill="x", pady=SPACING['xs'])
+            btn_frame = CTkFrame(nav_frame, fg_color="transparent")
+            btn_frame.pack(fill="x", pady=sp_xs)
             
-            btn = ctk.CTkButton(
+            btn = CTkButton(
                 btn_frame,
                 text=f"{icon}  {title}",
-                font=FONTS['button'],
+                font=f_button,
                 fg_color="transparent",
-                hover_color=COLORS['bg_hover'],
-                text_color=COLORS['text_primary'],
+                hover_color=c_hover,
+                text_color=c_primary,
                 anchor="w",
                 height=50,
-                corner_radius=RADIUS['md'],
-                command=lambda k=key: self._show_view(k)
+                corner_radius=r_md,
+                command=partial(show_view, key)
             )
             btn.pack(fill="x")
             
             # Shortcut label
-            ctk.CTkLabel(
+            CTkLabel(
                 btn_frame,
                 text=shortcut,
-                font=FONTS['caption'],
-                text_color=COLORS['text_muted']
+                font=f_caption,
+                text_color=c_muted
             ).place(relx=0.9, rely=0.5, anchor="center")
             
             self.nav_buttons[key] = btn
@@ -275,16 +358,20 @@ class App(ctk.CTk):
     def _setup_keyboard_shortcuts(self):
         """Setup global keyboard shortcuts."""
         self.bind('<Escape>', self._on_escape)
-        self.bind('<F1>', lambda e: self._show_view("booking"))
-        self.bind('<F2>', lambda e: self._show_view("checkin"))
-        self.bind('<F3>', lambda e: self._show_view("history"))
-        self.bind('<F4>', lambda e: self._show_view("dashboard"))
-        self.bind('<F5>', lambda e: self._show_view("stats"))
+        # Built once; _show_view takes the event argument, so no trampoline lambdas
+        self._shortcuts = {
+            '<F1>': partial(self._show_view, "booking"),
+            '<F2>': partial(self._show_view, "checkin"),
+            '<F3>': partial(self._show_view, "history"),
+            '<F4>': partial(self._show_view, "dashboard"),
+            '<F5>': partial(self._show_view, "stats"),
+        }
+        for sequence, handler in self._shortcuts.items():
+            self.bind(sequence, handler)
     
     def _start_activity_tracking(self):
         """Start tracking user activity for session timeout."""
-        import time
-        self._last_activity = time.time()
+        self._last_activity = monotonic()
         
         # Bind activity events
         self.bind('<Motion>', self._on_activity)
@@ -296,27 +383,47 @@ class App(ctk.CTk):
     
     def _on_activity(self, event=None):
         """Reset activity timer on user interaction."""
-        import time
-        self._last_activity = time.time()
+        # <Motion> fires at 60+ Hz; coalesce bursts using the timestamp Tk
+        # already stamps on each event (ms, wraps at 32 bits) before touching
+        # the clock
+        if event is not None:
+            if self._timeout_job is not None and (event.time - self._last_event_time) & 0xFFFFFFFF < 500:
+                return
+            self._last_event_time = event.time
+        
+        self._last_activity = monotonic()
         self._timeout_warning_shown = False
+        
+        # Real input after a timeout re-arms the (otherwise idle) deadline timer
+        if self._timeout_job is None and event is not None:
+            self._timeout_job = self.after(
+                (SESSION_TIMEOUT_SECONDS - 30) * 1000, self._check_timeout
+            )
     
     def _check_timeout(self):
-        """Check for session timeout."""
-        import time
-        
-        idle_time = time.time() - self._last_activity
-        
-        # Warning at 30 seconds before timeout
-        if idle_time >= SESSION_TIMEOUT_SECONDS - 30 and not self._timeout_warning_shown:
-            self._timeout_warning_shown = True
-            self._show_timeout_warning()
+        """
+        Check for session timeout.
+        Instead of polling, sleep until the next point where something can
+        happen (warning or timeout); activity since then just pushes it back.
+        After a timeout nothing is scheduled until the next input event.
+        """
+        self._timeout_job = None
+        idle_time = monotonic() - self._last_activity
+        warning_at = SESSION_TIMEOUT_SECONDS - 30  # Warning 30 seconds before timeout
         
-        # Timeout reached
         if idle_time >= SESSION_TIMEOUT_SECONDS:
             self._on_session_timeout()
+            return
+        elif idle_time >= warning_at:
+            if not self._timeout_warning_shown:
+                self._timeout_warning_shown = True
+                self._show_timeout_warning()
+            delay = SESSION_TIMEOUT_SECONDS - idle_time
+        else:
+            delay = warning_at - idle_time
         
         # Schedule next check
-        self._timeout_job = self.after(5000, self._check_timeout)
+        self._timeout_job = self.after(max(1000, int(delay * 1000)), self._check_timeout)
     
     def _show_timeout_warning(self):
         """Show a warning that session will timeout soon."""
@@ -325,8 +432,7 @@ class App(ctk.CTk):
     
     def _on_session_timeout(self):
         """Handle session timeout."""
-        import time
-        self._last_activity = time.time()
+        self._last_activity = monotonic()
         
         # Log the timeout
         audit_service.log_session_timeout()
@@ -354,7 +460,7 @@ class App(ctk.CTk):
         # Only need to update custom-colored elements
         pass
     
-    def _show_view(self, view_key: str):
+    def _show_view(self, view_key: str, event=None):
         """Switch to the specified view."""
         # Reset activity timer
         self._on_activity()
@@ -363,76 +469,93 @@ class App(ctk.CTk):
         if self.current_view:
             current = self.views.get(self.current_view)
             if current:
-                current.pack_forget()
-                if hasattr(current, 'on_hide'):
-                    current.on_hide()
-        
-        # Update nav button styles
-        for key, btn in self.nav_buttons.items():
-            if key == view_key:
-                btn.configure(fg_color=COLORS['accent'])
-            else:
-                btn.configure(fg_color="transparent")
+                current.on_hide()
+        
+        # Update nav button styles (only the two that change)
+        if self._active_nav_key != view_key:
+            if self._active_nav_key is not None:
+                self.nav_buttons[self._active_nav_key].configure(fg_color="transparent")
+            self.nav_buttons[view_key].configure(fg_color=COLORS['accent'])
+            self._active_nav_key = view_key
         
         # Show new view
-        view = self.views.get(view_key)
+        view = self._get_view(view_key)
         if view:
-            view.pack(fill="both", expand=True)
-            if hasattr(view, 'on_show'):
+            view.tkraise()
+            if view_key not in self._scrollable_for_view:
+                self._scrollable_for_view[view_key] = self._find_scrollable(view)
+            # Views with a cache_key() are only reloaded when their data changed
+            new_key = view.cache_key()
+            if new_key is None or new_key != self._view_cache_keys.get(view_key):
                 view.on_show()
+                self._view_cache_keys[view_key] = new_key
         
         self.current_view = view_key
-        
-        # Ensure close button is always on top
-        if hasattr(self, 'close_btn'):
-            self.close_btn.lift()
-        
-        # Ensure overlay stays at the absolute top
-        if hasattr(self, 'overlay_container'):
-            self.overlay_container.lift()
+        # No need to re-lift close_btn/overlay_container here: views are
+        # raised inside self.content, which never changes the root-level
+        # stacking order those two rely on.
 
     def show_overlay(self, component_class, **kwargs):
-        """Show an integrated modal overlay."""
-        # Clear existing
-        for widget in self.overlay_container.winfo_children():
-            widget.destroy()
-            
-        # Dim the background using a solid dark color (rgba not supported directly in CTk configure)
-        self.overlay_container.configure(fg_color="#07090d")
+        """Show an integrated modal overlay (one cached instance per component class)."""
+        component = self._overlay_cache.get(component_class)
+        if component is None:
+            component = component_class(self.overlay_container, **kwargs)
+            self._overlay_cache[component_class] = component
+        else:
+            component.reset(**kwargs)
+        
+        # Swap out whichever modal was showing; the last one stays placed
+        # inside the (hidden) container, so reopening it is just a lift
+        if self._overlay_component is not component:
+            if self._overlay_component is not None:
+                self._overlay_component.place_forget()
+            component.place(relx=0.5, rely=0.5, anchor="center")
+            self._overlay_component = component
+            self._overlay_scrollable = self._find_scrollable(component)
+        
         self.overlay_container.place(relx=0, rely=0, relwidth=1, relheight=1)
         self.overlay_container.lift()
-        
-        # Inject the component
-        component = component_class(self.overlay_container, **kwargs)
-        component.place(relx=0.5, rely=0.5, anchor="center")
+        self._overlay_visible = True
         
         return component
 
     def hide_overlay(self):
-        """Hide the integrated modal overlay."""
+        """Hide the integrated modal overlay (the component is kept for reuse)."""
         self.overlay_container.place_forget()
-        for widget in self.overlay_container.winfo_children():
-            widget.destroy()
+        self.overlay_container.lower()
+        self._overlay_visible = False
     
     def _bind_mouse_scroll(self):
-        """Global mouse scroll binding for Linux."""
-        self.bind_all("<Button-4>", self._on_mouse_scroll)
-        self.bind_all("<Button-5>", self._on_mouse_scroll)
+        """Mouse scroll binding for Linux (scrolls the visible view directly)."""
+        self.bind("<Button-4>", self._on_mouse_scroll)
+        self.bind("<Button-5>", self._on_mouse_scroll)
+
+    @staticmethod
+    def _find_scrollable(root):
+        """Return the outermost CTkScrollableFrame under root, or None."""
+        pending = deque([root])
+        while pending:
+            widget = pending.popleft()
+            if hasattr(widget, "_parent_canvas"):  # Characteristic of CTkScrollableFrame
+                return widget
+            pending.extend(widget.winfo_children())
+        return None
 
     def _on_mouse_scroll(self, event):
-        """Handle global mouse scroll events."""
-        # Find the widget under the mouse or just scroll the active view if possible
-        # Linux Button-4 is scroll up, Button-5 is scroll down
-        delta = 1 if event.num == 4 else -1
+        """Scroll the open overlay's or the current view's scrollable frame."""
+        # <Button-4/5> shadow the generic <Button> binding on this tag
+        self._on_activity(event)
         
-        # Try to find a CTkScrollableFrame in the hierarchy of the widget under mouse
-        widget = self.winfo_containing(event.x_root, event.y_root)
+        if self._overlay_visible:
+            scrollable = self._overlay_scrollable
+        else:
+            scrollable = self._scrollable_for_view.get(self.current_view)
+        if scrollable is None:
+            return
         
-        while widget:
-            if hasattr(widget, "_parent_canvas"): # Characteristic of CTkScrollableFrame
-                widget._parent_canvas.yview_scroll(-1 * delta, "units")
-                break
-            widget = widget.master
+        # Linux Button-4 is scroll up, Button-5 is scroll down
+        delta = 1 if event.num == 4 else -1
+        scrollable._parent_canvas.yview_scroll(-1 * delta, "units")
 
     def _on_booking_complete(self, ticket):
         """Handle booking completion."""
@@ -458,11 +581,12 @@ class App(ctk.CTk):
         if self._timeout_job:
             self.after_cancel(self._timeout_job)
         
-        # Stop camera and other services
+        # Stop camera and other services. self.views only holds views that
+        # were actually opened, so nothing is constructed just to be hidden.
         for view in self.views.values():
-            if hasattr(view, 'on_hide'):
-                view.on_hide()
+            view.on_hide()
         
+        self._executor.shutdown(wait=False, cancel_futures=True)
         self.destroy()
 
     def _toggle_fullscreen(self, event=None):
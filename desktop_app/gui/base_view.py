@@ -0,0 +1,26 @@
+"""
+Base View - Common protocol for the main content views.
+"""
+import customtkinter as ctk
+
+
+class BaseView(ctk.CTkFrame):
+    """
+    Base class for views switched by the App sidebar.
+    Subclasses override only the hooks they need.
+    """
+
+    def on_show(self):
+        """Called when view is shown."""
+        pass
+
+    def on_hide(self):
+        """Called when view is hidden."""
+        pass
+
+    def cache_key(self):
+        """
+        State signature used to skip on_show when nothing changed.
+        None means always call on_show.
+        """
+        return None
@@ -2,23 +2,35 @@
 Booking View - Flight booking interface.
 Handles airport selection, date picking, and passenger information entry.
 """
+import re
 from datetime import datetime, date, time, timedelta
+from functools import partial
+from time import monotonic
 from typing import Optional
 import customtkinter as ctk
-from tkcalendar import DateEntry
 
-from gui.theme import COLORS, FONTS, RADIUS, SPACING
-from gui.components.airport_selector import AirportSelector
+from gui.theme import (
+    COLORS, FONTS, DISPLAY_FONTS, RADIUS, SPACING,
+    primary_button_style, input_field_style, field_button_style
+)
+from gui.base_view import BaseView
 from gui.components.modal_selector import ModalSelector
-from gui.components.camera_widget import CameraWidget
+from gui.components.date_button import DateButton
 from database.db_manager import db
-from services.face_service import face_service
 from services.airport_service import airport_service
-from services.sound_service import sound_service
 from services.audit_service import audit_service
 
+_STEP_NAMES = ("Flight Details", "Passenger Info", "Confirmation")
 
-class BookingView(ctk.CTkFrame):
+# Minimum gap between face encodings requested by the camera
+_MIN_ENCODE_INTERVAL_S = 0.4
+
+# Input rules for step 2 (lengths match the Passenger columns)
+_PASSPORT_RE = re.compile(r"[A-Z0-9]{5,20}", re.ASCII)
+_NAME_RE = re.compile(r"[^\W\d_](?:[^\W\d_]|[ '\-]){0,99}")
+
+
+class BookingView(BaseView):
     """
     Flight booking view - multi-step booking process.
     Step 1: Select source and destination airports, date
@@ -30,7 +42,14 @@ class BookingView(ctk.CTkFrame):
         super().__init__(parent, fg_color=COLORS['bg_primary'], **kwargs)
         
         self.on_booking_complete = on_booking_complete
+        self._app = self.winfo_toplevel()  # App: overlays and the worker pool
         self.current_step = 1
+        self._step_frames = {}  # step number -> built container
+        self._encoding_in_flight = False
+        self._last_encode_ts = 0.0
+        self._capture_id = 0  # Bumped whenever a capture ends; older encodings are dropped
+        self._booking_in_flight = False  # Step 2 is locked while the booking is being written
+        self._step_builders = {1: self._build_step_1, 2: self._build_step_2, 3: self._build_step_3}
         self.booking_data = {
             'source': None,
             'destination': None,
@@ -40,41 +59,30 @@ class BookingView(ctk.CTkFrame):
             'last_name': '',
             'passport': '',
             'face_encoding': None,
+            'face_payload': None,  # face_encoding serialized + encrypted, ready to save
         }
         
-        # Prepare airport options for dropdowns
-        self.airport_options = [
-            f"{a['city']} ({a['iata']}) - {a['name']}" 
-            for a in airport_service.airports
-        ]
-        self.airport_map = {
-            f"{a['city']} ({a['iata']}) - {a['name']}": a 
-            for a in airport_service.airports
-        }
+        # Airport options for the selector (formatted once by the service)
+        self.airport_map = airport_service.options_map
+        self.airport_options = airport_service.options
         
         self._setup_ui()
     
     def _setup_ui(self):
         """Setup the booking interface."""
-        # Main container with scroll
-        self.main_scroll = ctk.CTkScrollableFrame(
-            self,
-            fg_color="transparent"
-        )
-        self.main_scroll.pack(fill="both", expand=True, padx=0, pady=0)
-        
-        # Center Content Wrapper
-        self.center_frame = ctk.CTkFrame(self.main_scroll, fg_color="transparent")
-        self.center_frame.pack(fill="y", expand=True, pady=SPACING['xl'])
+        # Title and steps stay fixed in a plain frame; only the step card
+        # (the part that can outgrow the screen) sits in the scrollable canvas
+        self.top_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.top_frame.pack(pady=(SPACING['xl'], 0))
 
         # Header
-        header = ctk.CTkFrame(self.center_frame, fg_color="transparent")
+        header = ctk.CTkFrame(self.top_frame, fg_color="transparent")
         header.pack(fill="x", pady=(0, SPACING['xl']))
         
         ctk.CTkLabel(
             header,
             text="✈ Book Your Flight",
-            font=("Segoe UI Display", 32, "bold"),
+            font=DISPLAY_FONTS['title'],
             text_color=COLORS['text_primary']
         ).pack(anchor="center")
         
@@ -88,6 +96,17 @@ class BookingView(ctk.CTkFrame):
         # Steps indicator
         self._create_steps_indicator()
         
+        # Scroll container for the step card
+        self.main_scroll = ctk.CTkScrollableFrame(
+            self,
+            fg_color="transparent"
+        )
+        self.main_scroll.pack(fill="both", expand=True, padx=0, pady=0)
+        
+        # Center Content Wrapper
+        self.center_frame = ctk.CTkFrame(self.main_scroll, fg_color="transparent")
+        self.center_frame.pack(fill="y", expand=True, pady=(0, SPACING['xl']))
+        
         # Content area (changes based on step)
         self.content_frame = ctk.CTkFrame(
             self.center_frame,
@@ -103,13 +122,12 @@ class BookingView(ctk.CTkFrame):
     
     def _create_steps_indicator(self):
         """Create the step progress indicator."""
-        steps_frame = ctk.CTkFrame(self.center_frame, fg_color="transparent")
+        steps_frame = ctk.CTkFrame(self.top_frame, fg_color="transparent")
         steps_frame.pack(fill="x", pady=SPACING['lg'])
         
         self.step_indicators = []
-        steps = ["Flight Details", "Passenger Info", "Confirmation"]
         
-        for i, step_name in enumerate(steps, 1):
+        for i, step_name in enumerate(_STEP_NAMES, 1):
             step_container = ctk.CTkFrame(steps_frame, fg_color="transparent")
             step_container.pack(side="left", expand=True, padx=SPACING['md'])
             
@@ -125,7 +143,7 @@ class BookingView(ctk.CTkFrame):
                 height=40,
                 fg_color=color,
                 corner_radius=20,
-                font=("Segoe UI", 16, "bold"),
+                font=DISPLAY_FONTS['step_number'],
                 text_color=text_color
             )
             circle.pack()
@@ -140,10 +158,20 @@ class BookingView(ctk.CTkFrame):
             label.pack(pady=(SPACING['xs'], 0))
             
             self.step_indicators.append((circle, label))
+        
+        # Step the indicators currently show as reached
+        self._indicator_step = self.current_step
     
     def _update_steps_indicator(self):
         """Update step indicators based on current step."""
-        for i, (circle, label) in enumerate(self.step_indicators, 1):
+        # Only the indicators between the old and new step change state
+        previous = self._indicator_step
+        if previous == self.current_step:
+            return
+        self._indicator_step = self.current_step
+        low, high = sorted((previous, self.current_step))
+        
+        for i, (circle, label) in enumerate(self.step_indicators[low:high], low + 1):
             is_active = i <= self.current_step
             color = COLORS['accent'] if is_active else COLORS['bg_card']
             text_color = COLORS['bg_primary'] if is_active else COLORS['text_muted']
@@ -151,20 +179,53 @@ class BookingView(ctk.CTkFrame):
             circle.configure(fg_color=color, text_color=text_color)
             label.configure(text_color=COLORS['text_primary'] if is_active else COLORS['text_muted'])
     
-    def _clear_content(self):
-        """Clear the content frame."""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def _switch_step(self, step: int):
+        """
+        Show the container for a step, building it on first use.
+        Step widgets are kept and toggled with pack_forget() rather than
+        destroyed and rebuilt on every Back/Continue.
+        """
+        if self._booking_in_flight and step != 2:
+            return  # Stay on step 2 until the booking result is in
+        
+        if self.current_step == 2 and step != 2 and 2 in self._step_frames:
+            self._stop_capture()
+        
+        previous = self._step_frames.get(self.current_step)
+        if previous is not None and self.current_step != step:
+            previous.pack_forget()
+        
+        container = self._ensure_step(step)
+        if not container.winfo_manager():  # Already packed when re-showing the current step
+            container.pack(fill="both", expand=True, padx=SPACING['xxl'], pady=SPACING['xl'])
+        
+        self.current_step = step
+        self._update_steps_indicator()
+    
+    def _ensure_step(self, step: int):
+        """Return the (unpacked) container for a step, building it on first use."""
+        container = self._step_frames.get(step)
+        if container is None:
+            # Built while unmapped: children are laid out in one pass when
+            # the container is packed, not once per child pack()
+            container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+            self._step_builders[step](container)
+            self._step_frames[step] = container
+        return container
     
     def _show_step_1(self):
         """Show step 1: Flight details."""
-        self._clear_content()
-        self.current_step = 1
-        self._update_steps_indicator()
-        
-        container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        container.pack(fill="both", expand=True, padx=SPACING['xxl'], pady=SPACING['xl'])
+        self._switch_step(1)
+        self.error_label.configure(text="")
         
+        # Pre-select if data exists
+        source = self.booking_data['source']
+        destination = self.booking_data['destination']
+        self.source_var.set(source.display if source else "Select Departure")
+        self.dest_var.set(destination.display if destination else "Select Arrival")
+    
+    def _build_step_1(self, container):
+        """Build step 1 widgets: Flight details."""
         # Route Selection Group
         route_group = ctk.CTkFrame(container, fg_color="transparent")
         route_group.pack(fill="x", pady=(0, SPACING['xl']))
@@ -181,16 +242,8 @@ class BookingView(ctk.CTkFrame):
         self.source_btn = ctk.CTkButton(
             route_group,
             textvariable=self.source_var,
-            height=60,
-            font=FONTS['body_large'],
-            fg_color=COLORS['bg_input'],
-            hover_color=COLORS['bg_hover'],
-            text_color=COLORS['text_primary'],
-            corner_radius=RADIUS['full'],
-            border_width=2,
-            border_color=COLORS['border'],
-            anchor="w",
-            command=lambda: self._open_selector("source")
+            command=lambda: self._open_selector("source"),
+            **field_button_style()
         )
         self.source_btn.pack(fill="x", pady=(0, SPACING['lg']))
         
@@ -206,16 +259,8 @@ class BookingView(ctk.CTkFrame):
         self.dest_btn = ctk.CTkButton(
             route_group,
             textvariable=self.dest_var,
-            height=60,
-            font=FONTS['body_large'],
-            fg_color=COLORS['bg_input'],
-            hover_color=COLORS['bg_hover'],
-            text_color=COLORS['text_primary'],
-            corner_radius=RADIUS['full'],
-            border_width=2,
-            border_color=COLORS['border'],
-            anchor="w",
-            command=lambda: self._open_selector("dest")
+            command=lambda: self._open_selector("dest"),
+            **field_button_style()
         )
         self.dest_btn.pack(fill="x", pady=(0, SPACING['lg']))
         
@@ -234,21 +279,9 @@ class BookingView(ctk.CTkFrame):
             text_color=COLORS['text_secondary']
         ).pack(anchor="w", pady=(0, SPACING['xs']))
         
-        self.date_entry = DateEntry(
-            dep_container,
-            width=20,
-            background=COLORS['bg_secondary'],
-            foreground='white',
-            borderwidth=0,
-            font=FONTS['body_large'],
-            mindate=date.today(),
-            date_pattern='yyyy-mm-dd',
-            headersbackground=COLORS['bg_card'],
-            headersforeground='white',
-            selectbackground=COLORS['accent'],
-            selectforeground='black'
-        )
-        self.date_entry.pack(fill="x", ipady=12) # Premium height
+        # Calendars are only built when a date field is first tapped
+        self.date_entry = DateButton(dep_container, value=date.today(), mindate=date.today())
+        self.date_entry.pack(fill="x")
         
         # Return Date
         ret_container = ctk.CTkFrame(datetime_frame, fg_color="transparent")
@@ -261,23 +294,13 @@ class BookingView(ctk.CTkFrame):
             text_color=COLORS['text_secondary']
         ).pack(anchor="w", pady=(0, SPACING['xs']))
         
-        self.return_date_entry = DateEntry(
+        # Default return date is 1 week later
+        self.return_date_entry = DateButton(
             ret_container,
-            width=20,
-            background=COLORS['bg_secondary'],
-            foreground='white',
-            borderwidth=0,
-            font=FONTS['body_large'],
-            mindate=date.today(),
-            date_pattern='yyyy-mm-dd',
-            headersbackground=COLORS['bg_card'],
-            headersforeground='white',
-            selectbackground=COLORS['accent'],
-            selectforeground='black'
+            value=date.today() + timedelta(days=7),
+            mindate=date.today()
         )
-        self.return_date_entry.pack(fill="x", ipady=12)
-        # Set default return date to 1 week later
-        self.return_date_entry.set_date(date.today() + timedelta(days=7))
+        self.return_date_entry.pack(fill="x")
         
         # Error message label
         self.error_label = ctk.CTkLabel(
@@ -292,37 +315,31 @@ class BookingView(ctk.CTkFrame):
         ctk.CTkButton(
             container,
             text="Continue to Passenger Details →",
-            font=FONTS['button'],
-            fg_color=COLORS['accent'],
-            hover_color=COLORS['accent_hover'],
-            height=55,
-            corner_radius=RADIUS['lg'],
-            command=self._validate_step_1
+            command=self._validate_step_1,
+            **primary_button_style(height=55)
         ).pack(fill="x", pady=(SPACING['lg'], 0))
-        
-        # Pre-select if data exists
-        if self.booking_data['source']:
-             display = f"{self.booking_data['source']['city']} ({self.booking_data['source']['iata']}) - {self.booking_data['source']['name']}"
-             self.source_var.set(display)
-        else:
-             self.source_var.set("Select Departure")
-             
-        if self.booking_data['destination']:
-             display = f"{self.booking_data['destination']['city']} ({self.booking_data['destination']['iata']}) - {self.booking_data['destination']['name']}"
-             self.dest_var.set(display)
-        else:
-             self.dest_var.set("Select Arrival")
-
     
     def _show_step_2(self):
         """Show step 2: Passenger details and face capture."""
-        self._clear_content()
-        self.current_step = 2
-        self._update_steps_indicator()
-        
-        container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        container.pack(fill="both", expand=True, padx=SPACING['xxl'], pady=SPACING['xl'])
+        self._switch_step(2)
+        self.step2_error.configure(text="")
         
+        # Pre-fill data
+        for entry, key in (
+            (self.first_name_entry, 'first_name'),
+            (self.last_name_entry, 'last_name'),
+            (self.passport_entry, 'passport'),
+        ):
+            entry.delete(0, "end")
+            if self.booking_data[key]:
+                entry.insert(0, self.booking_data[key])
+        
+        self.capture_status.configure(text="● Camera ready", text_color=COLORS['text_muted'])
+        self.start_capture_btn.configure(state="normal", text="📷 Start Capturing")
+        self.complete_btn.configure(state="normal", text="Complete Booking →")
+    
+    def _build_step_2(self, container):
+        """Build step 2 widgets: Passenger details and face capture."""
         # Two column layout
         left_col = ctk.CTkFrame(container, fg_color="transparent")
         left_col.pack(side="left", fill="both", expand=True, padx=(0, SPACING['xl']))
@@ -349,13 +366,7 @@ class BookingView(ctk.CTkFrame):
         self.first_name_entry = ctk.CTkEntry(
             left_col,
             placeholder_text="Enter first name",
-            font=FONTS['body_large'],
-            height=60,
-            fg_color=COLORS['bg_input'],
-            border_color=COLORS['border'],
-            border_width=2,
-            corner_radius=RADIUS['full'],
-            width=550
+            **input_field_style(width=550)
         )
         self.first_name_entry.pack(fill="x", pady=(0, SPACING['lg']))
         
@@ -370,13 +381,7 @@ class BookingView(ctk.CTkFrame):
         self.last_name_entry = ctk.CTkEntry(
             left_col,
             placeholder_text="Enter last name",
-            font=FONTS['body_large'],
-            height=60,
-            fg_color=COLORS['bg_input'],
-            border_color=COLORS['border'],
-            border_width=2,
-            corner_radius=RADIUS['full'],
-            width=550
+            **input_field_style(width=550)
         )
         self.last_name_entry.pack(fill="x", pady=(0, SPACING['lg']))
         
@@ -391,13 +396,7 @@ class BookingView(ctk.CTkFrame):
         self.passport_entry = ctk.CTkEntry(
             left_col,
             placeholder_text="Enter passport number",
-            font=FONTS['body_large'],
-            height=60,
-            fg_color=COLORS['bg_input'],
-            border_color=COLORS['border'],
-            border_width=2,
-            corner_radius=RADIUS['full'],
-            width=550
+            **input_field_style(width=550)
         )
         self.passport_entry.pack(fill="x", pady=(0, SPACING['lg']))
         
@@ -429,6 +428,10 @@ class BookingView(ctk.CTkFrame):
         cam_wrap = ctk.CTkFrame(right_col, fg_color=COLORS['bg_primary'], corner_radius=RADIUS['lg'])
         cam_wrap.pack(fill="both", expand=True, pady=(0, SPACING['md']))
         
+        # The camera stack (OpenCV, face_recognition) loads only once a
+        # booking actually reaches step 2
+        from gui.components.camera_widget import CameraWidget
+        
         self.camera = CameraWidget(
             cam_wrap,
             width=400,
@@ -466,7 +469,7 @@ class BookingView(ctk.CTkFrame):
         nav_frame = ctk.CTkFrame(container, fg_color="transparent")
         nav_frame.pack(fill="x", pady=(SPACING['xl'], 0))
         
-        ctk.CTkButton(
+        self.step2_back_btn = ctk.CTkButton(
             nav_frame,
             text="← Back",
             font=FONTS['button'],
@@ -479,55 +482,55 @@ class BookingView(ctk.CTkFrame):
             width=120,
             corner_radius=RADIUS['lg'],
             command=self._show_step_1
-        ).pack(side="left")
+        )
+        self.step2_back_btn.pack(side="left")
         
-        ctk.CTkButton(
+        self.complete_btn = ctk.CTkButton(
             nav_frame,
             text="Complete Booking →",
-            font=FONTS['button'],
-            fg_color=COLORS['accent'],
-            hover_color=COLORS['accent_hover'],
-            height=50,
-            corner_radius=RADIUS['lg'],
-            command=self._validate_step_2
-        ).pack(side="right")
-        
-        # Pre-fill data
-        self.first_name_entry.insert(0, self.booking_data['first_name'])
-        self.last_name_entry.insert(0, self.booking_data['last_name'])
-        self.passport_entry.insert(0, self.booking_data['passport'])
+            command=self._validate_step_2,
+            **primary_button_style()
+        )
+        self.complete_btn.pack(side="right")
     
-    def _show_step_3(self, ticket):
-        """Show step 3: Confirmation."""
-        self._clear_content()
-        self.current_step = 3
-        self._update_steps_indicator()
-        
-        container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        container.pack(fill="both", expand=True, padx=SPACING['xxl'], pady=SPACING['xl'])
-        
+    def _show_step_3(self, ticket, data: dict):
+        """Show step 3: Confirmation of the booking made from data."""
+        self._switch_step(3)
+        
+        self.confirm_ticket_label.configure(text=f"Ticket # {ticket.ticket_number}")
+        self.confirm_route_label.configure(text=f"{ticket.source_airport} ➔ {ticket.destination_airport}")
+        self.confirm_dates_label.configure(
+            text=f"🛫 {ticket.flight_date}  |  🛬 {data['return_date']}"
+        )
+        self.confirm_passenger_label.configure(
+            text=f"Passenger: {data['first_name']} {data['last_name']}"
+        )
+    
+    def _build_step_3(self, container):
+        """Build step 3 widgets: Confirmation (texts are filled in by _show_step_3)."""
         # Success icon
         ctk.CTkLabel(
             container,
             text="✓",
-            font=("Segoe UI", 80),
+            font=DISPLAY_FONTS['icon_large'],
             text_color=COLORS['success']
         ).pack(pady=SPACING['lg'])
         
         ctk.CTkLabel(
             container,
             text="Booking Confirmed!",
-            font=("Segoe UI Display", 28, "bold"),
+            font=DISPLAY_FONTS['title_small'],
             text_color=COLORS['text_primary']
         ).pack()
         
         # Ticket number
-        ctk.CTkLabel(
+        self.confirm_ticket_label = ctk.CTkLabel(
             container,
-            text=f"Ticket # {ticket.ticket_number}",
+            text="",
             font=FONTS['subheading'],
             text_color=COLORS['accent']
-        ).pack(pady=SPACING['sm'])
+        )
+        self.confirm_ticket_label.pack(pady=SPACING['sm'])
         
         # Flight details summary
         details = ctk.CTkFrame(container, fg_color=COLORS['bg_card'], corner_radius=RADIUS['lg'], border_width=1, border_color=COLORS['border'])
@@ -537,35 +540,34 @@ class BookingView(ctk.CTkFrame):
         details_content.pack(padx=SPACING['xl'], pady=SPACING['lg'])
         
         # Route
-        route_text = f"{ticket.source_airport} ➔ {ticket.destination_airport}"
-        ctk.CTkLabel(
+        self.confirm_route_label = ctk.CTkLabel(
             details_content,
-            text=route_text,
-            font=("Segoe UI", 36, "bold"),
+            text="",
+            font=DISPLAY_FONTS['ticket_number'],
             text_color=COLORS['text_primary']
-        ).pack()
+        )
+        self.confirm_route_label.pack()
         
         # Dates
         dates_frame = ctk.CTkFrame(details_content, fg_color="transparent")
         dates_frame.pack(pady=SPACING['sm'])
         
-        dep_text = f"🛫 {ticket.flight_date}"
-        ret_text = f"🛬 {self.booking_data['return_date']}"
-        
-        ctk.CTkLabel(
+        self.confirm_dates_label = ctk.CTkLabel(
             dates_frame,
-            text=f"{dep_text}  |  {ret_text}",
+            text="",
             font=FONTS['body_large'],
             text_color=COLORS['text_secondary']
-        ).pack()
+        )
+        self.confirm_dates_label.pack()
         
         # Passenger
-        ctk.CTkLabel(
+        self.confirm_passenger_label = ctk.CTkLabel(
             details_content,
-            text=f"Passenger: {self.booking_data['first_name']} {self.booking_data['last_name']}",
+            text="",
             font=FONTS['body'],
             text_color=COLORS['text_secondary']
-        ).pack()
+        )
+        self.confirm_passenger_label.pack()
         
         # Instructions
         ctk.CTkLabel(
@@ -579,41 +581,33 @@ class BookingView(ctk.CTkFrame):
         ctk.CTkButton(
             container,
             text="Book Another Flight",
-            font=FONTS['button'],
-            fg_color=COLORS['accent'],
-            hover_color=COLORS['accent_hover'],
-            height=50,
-            width=250,
-            corner_radius=RADIUS['lg'],
-            command=self._reset_booking
+            command=self._reset_booking,
+            **primary_button_style(width=250)
         ).pack()
     
     def _open_selector(self, target: str):
         """Open the integrated modal selector for airports."""
         title = "Select Departure Airport" if target == "source" else "Select Arrival Airport"
         current = self.source_var.get() if target == "source" else self.dest_var.get()
+        on_select = self._set_source if target == "source" else self._set_destination
         
-        def on_select(value):
-            if target == "source":
-                self.source_var.set(value)
-            else:
-                self.dest_var.set(value)
-        
-        # Access App instance to show overlay
-        app = self.master.master # BookingView -> content -> App
-        app.show_overlay(
+        self._app.show_overlay(
             ModalSelector,
-            items=self.airport_options,
+            items_provider=airport_service.search_options,
             title=title,
             current_value=current,
             on_select=on_select,
-            on_close=app.hide_overlay
+            on_close=self._app.hide_overlay
         )
 
-    def _update_booking(self, key, value):
-        """Update booking data."""
-        self.booking_data[key] = value
+    def _set_source(self, value: str):
+        """Apply a departure airport picked in the selector."""
+        self.source_var.set(value)
     
+    def _set_destination(self, value: str):
+        """Apply an arrival airport picked in the selector."""
+        self.dest_var.set(value)
+
     def _validate_step_1(self):
         """Validate step 1 and proceed."""
         self.error_label.configure(text="")
@@ -639,7 +633,7 @@ class BookingView(ctk.CTkFrame):
              self.error_label.configure(text="Invalid destination airport selected")
              return
 
-        if source_data['iata'] == dest_data['iata']:
+        if source_data.iata == dest_data.iata:
             self.error_label.configure(text="Source and destination cannot be the same")
             return
         
@@ -662,23 +656,19 @@ class BookingView(ctk.CTkFrame):
         
         first_name = self.first_name_entry.get().strip()
         last_name = self.last_name_entry.get().strip()
-        passport = self.passport_entry.get().strip()
-        
-        if not first_name:
-            self.step2_error.configure(text="Please enter first name")
-            return
-        
-        if not last_name:
-            self.step2_error.configure(text="Please enter last name")
-            return
-        
-        if not passport:
-            self.step2_error.configure(text="Please enter passport number")
-            return
+        passport = self.passport_entry.get().strip().upper()
         
-        if len(passport) < 5:
-            self.step2_error.configure(text="Invalid passport number")
-            return
+        # One regex match per field; an empty value fails it as well
+        fields = (
+            (first_name, _NAME_RE, "first name"),
+            (last_name, _NAME_RE, "last name"),
+            (passport, _PASSPORT_RE, "passport number"),
+        )
+        for value, pattern, label in fields:
+            if not pattern.fullmatch(value):
+                message = f"Invalid {label}" if value else f"Please enter {label}"
+                self.step2_error.configure(text=message)
+                return
         
         if self.booking_data['face_encoding'] is None:
             self.step2_error.configure(text="Please capture your face")
@@ -689,25 +679,60 @@ class BookingView(ctk.CTkFrame):
         self.booking_data['last_name'] = last_name
         self.booking_data['passport'] = passport
         
-        # Stop camera
-        self.camera.stop()
+        # Create booking (DB + encrypted face file) off the UI thread
+        self.complete_btn.configure(state="disabled", text="Booking...")
+        self.step2_back_btn.configure(state="disabled")
+        self._booking_in_flight = True
+        # The worker gets its own snapshot: a retake or reset on the Tk
+        # thread can't change what is being written
+        self._app.run_in_background(
+            partial(self._create_booking, dict(self.booking_data)),
+            on_done=self._finish_booking,
+            on_error=self._on_booking_failed
+        )
         
-        # Create booking
-        try:
-            ticket = self._create_booking()
-            self._show_step_3(ticket)
-            
-            if self.on_booking_complete:
-                self.on_booking_complete(ticket)
-                
-        except Exception as e:
-            self.step2_error.configure(text=f"Booking failed: {str(e)}")
+        # Build the confirmation while the worker writes, so it only has to be packed
+        self._ensure_step(3)
+    
+    def _finish_booking(self, result):
+        """Show the confirmation once the background booking has finished."""
+        ticket, data = result
+        self._booking_in_flight = False
+        self.step2_back_btn.configure(state="normal")
+        
+        # Log from the snapshot the booking was made from.
+        # Audit append and sound don't gate the confirmation.
+        self._app.run_in_background(partial(
+            self._log_booking,
+            ticket.ticket_number,
+            f"{data['first_name']} {data['last_name']}",
+            f"{data['source'].iata}->{data['destination'].iata}"
+        ))
+        
+        if self.on_booking_complete:
+            self.on_booking_complete(ticket)
+        
+        # The encoding now lives in the encrypted face file
+        self.booking_data['face_encoding'] = None
+        self.booking_data['face_payload'] = None
+        self._show_step_3(ticket, data)
+    
+    def _on_booking_failed(self, error: Exception):
+        """Report a failed background booking and let the user retry."""
+        self._booking_in_flight = False
+        self.step2_back_btn.configure(state="normal")
+        self.complete_btn.configure(state="normal", text="Complete Booking →")
+        self.step2_error.configure(text=f"Booking failed: {str(error)}")
     
     def _start_face_capture(self):
         """Start the face capture process when button is clicked."""
         # Disable the button
         self.start_capture_btn.configure(state="disabled", text="📷 Capturing...")
         
+        # A (re)take replaces any earlier capture
+        self.booking_data['face_encoding'] = None
+        self.booking_data['face_payload'] = None
+        
         # Update status
         self.capture_status.configure(
             text="● Looking for face...",
@@ -719,16 +744,64 @@ class BookingView(ctk.CTkFrame):
     
     def _on_face_captured(self, frame):
         """Handle face capture from camera."""
-        # Get face encoding
+        # Already have a good encoding - nothing more to compute
+        if self.booking_data['face_encoding'] is not None:
+            return
+        
+        # Encoding takes 100-300 ms on CPU: run one at a time, off the UI thread
+        if self._encoding_in_flight:
+            return
+        now = monotonic()
+        if now - self._last_encode_ts < _MIN_ENCODE_INTERVAL_S:
+            return
+        self._last_encode_ts = now
+        self._encoding_in_flight = True
+        
+        self._app.run_in_background(
+            partial(self._encode_face, frame),
+            on_done=partial(self._on_face_encoded, self._capture_id),
+            on_error=partial(self._on_face_encoding_failed, self._capture_id)
+        )
+    
+    @staticmethod
+    def _encode_face(frame):
+        """
+        Encode a captured frame (worker thread).
+        The encoding is also encrypted here, so Complete Booking only has
+        to write the file. Returns (encoding, payload), or None if no face.
+        """
+        from services.face_service import face_service
+        
         encoding = face_service.get_face_encoding(frame)
+        if encoding is None:
+            return None
+        return encoding, face_service.encrypt_face_encoding(encoding)
+    
+    def _stop_capture(self):
+        """Stop the camera and discard any encoding still being computed."""
+        self._capture_id += 1
+        self.camera.stop()
+    
+    def _on_face_encoded(self, capture_id: int, result):
+        """Apply a finished face encoding (Tk thread)."""
+        self._encoding_in_flight = False
+        
+        # The capture it came from was abandoned (left step 2, view hidden)
+        if capture_id != self._capture_id:
+            return
         
-        if encoding is not None:
-            self.booking_data['face_encoding'] = encoding
+        from services.sound_service import sound_service  # pygame loads with the first capture
+        
+        if result is not None:
+            self.booking_data['face_encoding'], self.booking_data['face_payload'] = result
             sound_service.play_shutter()  # Camera shutter sound
             self.capture_status.configure(
                 text="✓ Face captured successfully!",
                 text_color=COLORS['success']
             )
+            # Done capturing - stop the feed and offer a retake
+            self.camera.stop()
+            self.start_capture_btn.configure(state="normal", text="📷 Retake Photo")
         else:
             sound_service.play_error()
             self.capture_status.configure(
@@ -736,50 +809,62 @@ class BookingView(ctk.CTkFrame):
                 text_color=COLORS['error']
             )
     
-    def _create_booking(self):
-        """Create the actual booking in database."""
-        # Check if passenger exists
-        passenger = db.get_passenger_by_passport(self.booking_data['passport'])
-        
-        if not passenger:
-            # Create new passenger
+    def _on_face_encoding_failed(self, capture_id: int, error: Exception):
+        """Treat an encoding error like a frame without a usable face."""
+        print(f"Face encoding error: {error}")
+        self._on_face_encoded(capture_id, None)
+    
+    def _create_booking(self, data: dict):
+        """
+        Create the actual booking in database.
+        Runs on a worker thread - must not touch any widgets.
+        """
+        from services.face_service import face_service
+        
+        source = data['source']
+        dest = data['destination']
+        
+        # One write transaction for the whole booking: the db calls below
+        # join this session, so there is a single commit/fsync
+        with db.get_write_session():
+            # Insert the passenger, or reuse the one with this passport
             passenger = db.create_passenger(
-                first_name=self.booking_data['first_name'],
-                last_name=self.booking_data['last_name'],
-                passport_number=self.booking_data['passport']
+                first_name=data['first_name'],
+                last_name=data['last_name'],
+                passport_number=data['passport']
             )
-        
-        # Save face encoding
-        if self.booking_data['face_encoding'] is not None:
-            face_file = face_service.save_face_encoding(
-                self.booking_data['face_encoding'],
-                passenger.id
+            
+            # Save face encoding
+            if data['face_encoding'] is not None:
+                face_file = face_service.save_face_encoding(
+                    data['face_encoding'],
+                    passenger.id,
+                    encrypted=data['face_payload']
+                )
+                db.update_passenger_face(passenger.id, face_file)
+            
+            # Create ticket
+            ticket = db.create_ticket(
+                passenger_id=passenger.id,
+                source_airport=source.iata,
+                source_airport_name=source.name,
+                destination_airport=dest.iata,
+                destination_airport_name=dest.name,
+                flight_date=data['date'],
+                flight_time=data['time']
             )
-            db.update_passenger_face(passenger.id, face_file)
-        
-        # Create ticket
-        source = self.booking_data['source']
-        dest = self.booking_data['destination']
-        
-        ticket = db.create_ticket(
-            passenger_id=passenger.id,
-            source_airport=source['iata'],
-            source_airport_name=source['name'],
-            destination_airport=dest['iata'],
-            destination_airport_name=dest['name'],
-            flight_date=self.booking_data['date'],
-            flight_time=self.booking_data['time']
-        )
         
-        # Log booking and play success sound
-        audit_service.log_booking(
-            ticket.ticket_number,
-            passenger.full_name,
-            f"{source['iata']}->{dest['iata']}"
-        )
+        return ticket, data
+    
+    def _log_booking(self, ticket_number: str, passenger_name: str, route: str):
+        """
+        Log booking and play success sound.
+        Runs on a worker thread after the confirmation is already showing.
+        """
+        from services.sound_service import sound_service
+        
+        audit_service.log_booking(ticket_number, passenger_name, route)
         sound_service.play_success()
-        
-        return ticket
     
     def _reset_booking(self):
         """Reset for new booking."""
@@ -793,10 +878,31 @@ class BookingView(ctk.CTkFrame):
             'last_name': '',
             'passport': '',
             'face_encoding': None,
+            'face_payload': None,  # face_encoding serialized + encrypted, ready to save
         }
+        
+        # Step 1 widgets are reused, so put the dates back to their defaults
+        today = date.today()
+        for entry, default in ((self.date_entry, today), (self.return_date_entry, today + timedelta(days=7))):
+            entry.set_mindate(today)
+            entry.set_date(default)
+        
+        # Don't leave the previous passenger's details in the hidden step widgets
+        if 2 in self._step_frames:
+            for entry in (self.first_name_entry, self.last_name_entry, self.passport_entry):
+                entry.delete(0, "end")
+        if 3 in self._step_frames:
+            for label in (
+                self.confirm_ticket_label,
+                self.confirm_route_label,
+                self.confirm_dates_label,
+                self.confirm_passenger_label,
+            ):
+                label.configure(text="")
+        
         self._show_step_1()
     
     def on_hide(self):
         """Called when view is hidden."""
         if hasattr(self, 'camera'):
-            self.camera.stop()
+            self._stop_capture()
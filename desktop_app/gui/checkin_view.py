@@ -2,14 +2,19 @@
 Check-In View - Face recognition and QR code based check-in.
 Automatically recognizes faces or scans QR codes and generates boarding passes.
 """
+from functools import partial
+from time import monotonic
 from typing import Optional, Dict
 import customtkinter as ctk
+import cv2
+import numpy as np
 import logging
 
 from gui.theme import COLORS, FONTS, RADIUS, SPACING
+from gui.base_view import BaseView
 from gui.components.camera_widget import CameraWidget
 from database.db_manager import db
-from database.models import TicketStatus
+from database.models import STATUS_BOOKED
 from services.face_service import face_service
 from services.voice_service import voice_service
 from services.boarding_pass_service import boarding_pass_service
@@ -20,8 +25,22 @@ from services.qr_service import qr_service
 
 logger = logging.getLogger(__name__)
 
+# Camera frames to skip after a recognition result before trying the next one
+_RECOGNITION_COOLDOWN_FRAMES = 5
 
-class CheckInView(ctk.CTkFrame):
+# Booked-ticket map older than this is reloaded before use (picks up bookings made elsewhere)
+_BOOKED_TTL_S = 30.0
+
+
+def _dhash(frame) -> int:
+    """64-bit difference hash of a frame (row-wise gradients of a 9x8 grayscale thumbnail)."""
+    small = cv2.resize(frame, (9, 8), interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    bits = gray[:, 1:] > gray[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+
+class CheckInView(BaseView):
     """
     Check-in view with face recognition.
     Detects faces, matches against booked passengers, generates boarding pass.
@@ -29,16 +48,33 @@ class CheckInView(ctk.CTkFrame):
     
     def __init__(self, parent, **kwargs):
         super().__init__(parent, fg_color=COLORS['bg_primary'], **kwargs)
+        self._app = self.winfo_toplevel()  # App: the worker pool
         
         self.known_encodings: Dict = {}
+        # Same encodings packed as one quantized matrix for recognition
+        self._enc_matrix = face_service.build_encoding_matrix({})
         self.passenger_lookup: Dict = {}  # passenger_id -> passenger
+        # Ticket lookups memoized for the current check-in pass
+        # (cleared on check-in and when the pass ends)
+        self._lookup_memo: Dict = {}
+        # passenger_id -> booked ticket, loaded with one query (see _load_booked_tickets)
+        self._booked_by_pid: Dict = {}
+        self._booked_loaded_at = 0.0
         self.last_recognized_id: Optional[int] = None
         self.is_processing = False
         self._last_led_state = None  # Track state to avoid spamming serial
         
+        # Recognition / QR decode runs one frame at a time on the worker pool;
+        # frames arriving meanwhile are dropped. Bumping the id discards
+        # a result still being computed.
+        self._recognition_in_flight = False
+        self._recognition_id = 0
+        self._last_result_seq = -_RECOGNITION_COOLDOWN_FRAMES  # Camera frame_seq when the last result came in
+        
         # Check-in mode: 'face' or 'qr'
         self.checkin_mode = 'face'
         self._qr_scanning = False
+        self._last_frame_hash: Optional[int] = None  # Frame last sent to the QR decoder
         
         self._setup_ui()
     
@@ -184,6 +220,8 @@ class CheckInView(ctk.CTkFrame):
     def _set_mode(self, mode: str):
         """Switch between face recognition and QR code mode."""
         self.checkin_mode = mode
+        self._cancel_recognition()  # A pending result belongs to the old mode
+        self._last_frame_hash = None
         
         if mode == 'face':
             self.face_mode_btn.configure(
@@ -274,10 +312,31 @@ class CheckInView(ctk.CTkFrame):
         )
         self.bp_route.pack()
         
-        # Details grid
+        # Details grid: cells are built once, check-ins only set their values
         self.bp_details = ctk.CTkFrame(self.boarding_frame, fg_color="transparent")
         self.bp_details.pack(pady=SPACING['md'])
         
+        self.bp_detail_values = []
+        for label, highlight in (("SEAT", True), ("GATE", True), ("TIME", False), ("DATE", False)):
+            item = ctk.CTkFrame(self.bp_details, fg_color="transparent")
+            item.pack(side="left", padx=SPACING['md'])
+            
+            ctk.CTkLabel(
+                item,
+                text=label,
+                font=FONTS['caption'],
+                text_color=COLORS['text_muted']
+            ).pack()
+            
+            value_label = ctk.CTkLabel(
+                item,
+                text="",
+                font=FONTS['subheading'] if highlight else FONTS['body'],
+                text_color=COLORS['accent'] if highlight else COLORS['text_primary']
+            )
+            value_label.pack()
+            self.bp_detail_values.append(value_label)
+        
         # Print button
         self.print_btn = ctk.CTkButton(
             content,
@@ -306,15 +365,26 @@ class CheckInView(ctk.CTkFrame):
         """Load all face encodings from booked passengers."""
         passengers = db.get_all_passengers()
         self.known_encodings = face_service.load_all_encodings(passengers)
+        self._enc_matrix = face_service.build_encoding_matrix(self.known_encodings)
         
-        # Build lookup
-        self.passenger_lookup = {p.id: p for p in passengers if p.face_file}
+        # Build lookup (all passengers - QR and manual check-in use it too)
+        self.passenger_lookup = {p.id: p for p in passengers}
         
         print(f"Loaded {len(self.known_encodings)} face encodings")
     
-    def _on_faces_detected(self, faces):
+    def _load_booked_tickets(self):
+        """Map passenger_id -> booked ticket with a single query."""
+        # get_booked_tickets is ordered by flight date, so later flights overwrite earlier ones
+        self._booked_by_pid = {t.passenger_id: t for t in db.get_booked_tickets()}
+        self._booked_loaded_at = monotonic()
+    
+    def _on_faces_detected(self, faces, seq: int):
         """Handle face detection - try to recognize or scan QR."""
-        if self.is_processing:
+        if self.is_processing or self._recognition_in_flight:
+            return
+        
+        # The frames right after a result are near-duplicates of the one just processed
+        if seq - self._last_result_seq < _RECOGNITION_COOLDOWN_FRAMES:
             return
         
         # Get current frame for recognition/QR scanning
@@ -324,7 +394,15 @@ class CheckInView(ctk.CTkFrame):
         
         # QR Mode - scan for QR codes
         if self._qr_scanning:
-            self._scan_qr_code(frame)
+            # Nothing moved since the last decode - it would find the same thing
+            frame_hash = _dhash(frame)
+            if frame_hash == self._last_frame_hash:
+                return
+            self._last_frame_hash = frame_hash
+            self._run_recognition(
+                partial(qr_service.detect_and_decode, frame),
+                self._on_qr_decoded
+            )
             return
             
         if not faces:
@@ -334,9 +412,49 @@ class CheckInView(ctk.CTkFrame):
                 self._last_led_state = "off"
             return
             
-        # Try to recognize
-        result = face_service.recognize_face(frame, self.known_encodings)
-        
+        # Try to recognize (100-300 ms of encoding, so off the UI thread).
+        # The camera already located the faces: encode the largest one directly.
+        largest = max(faces, key=lambda face: face['bbox'][2] * face['bbox'][3])
+        self._run_recognition(
+            partial(
+                face_service.recognize_face_matrix,
+                frame, self._enc_matrix, largest['bbox']
+            ),
+            self._on_face_recognized
+        )
+    
+    def _run_recognition(self, func, on_done):
+        """Run a recognition / QR decode call on the worker pool."""
+        self._recognition_in_flight = True
+        self._app.run_in_background(
+            func,
+            on_done=partial(self._on_recognition_done, self._recognition_id, on_done),
+            on_error=partial(self._on_recognition_failed, self._recognition_id)
+        )
+    
+    def _on_recognition_done(self, recognition_id: int, on_done, result):
+        """Apply a worker result unless it was discarded meanwhile."""
+        if recognition_id != self._recognition_id:
+            return
+        self._recognition_in_flight = False
+        self._last_result_seq = self.camera.frame_seq
+        if not self.is_processing:
+            on_done(result)
+    
+    def _on_recognition_failed(self, recognition_id: int, error: Exception):
+        """Log a failed recognition / QR decode; the next frame tries again."""
+        if recognition_id != self._recognition_id:
+            return
+        self._recognition_in_flight = False
+        logger.error(f"Recognition error: {error}")
+    
+    def _cancel_recognition(self):
+        """Discard any recognition still running on the worker pool."""
+        self._recognition_id += 1
+        self._recognition_in_flight = False
+    
+    def _on_face_recognized(self, result):
+        """Handle a face recognition result."""
         if result:
             passenger_id, confidence = result
             
@@ -358,37 +476,63 @@ class CheckInView(ctk.CTkFrame):
                     text_color=COLORS['error']
                 )
     
-    def _scan_qr_code(self, frame):
-        """Scan frame for QR codes."""
-        try:
-            qr_data = qr_service.decode_qr_from_image(frame)
+    def _on_qr_decoded(self, result):
+        """Handle a QR decode result: (ticket data, bounds)."""
+        qr_data, bounds = result
+        if qr_data and qr_data.get('type') == 'flight_ticket':
+            ticket_number = qr_data.get('ticket')
             
-            if qr_data and qr_data.get('type') == 'flight_ticket':
-                ticket_number = qr_data.get('ticket')
+            if ticket_number:
+                # Avoid repeated triggers
+                if hasattr(self, '_last_qr_ticket') and self._last_qr_ticket == ticket_number:
+                    return
                 
-                if ticket_number:
-                    # Avoid repeated triggers
-                    if hasattr(self, '_last_qr_ticket') and self._last_qr_ticket == ticket_number:
-                        return
-                    
-                    self._last_qr_ticket = ticket_number
-                    logger.info(f"QR Code detected: {ticket_number}")
-                    
-                    # Show scanning indicator and turn box green
-                    self.camera.set_qr_detections(None, success=True)
-                    self.recognition_label.configure(
-                        text="● Processing check-in...",
-                        text_color=COLORS['accent']
-                    )
-                    
-                    # Process check-in
-                    self.after(100, lambda: self._process_qr_checkin(ticket_number))
-        except Exception as e:
-            logger.error(f"QR scan error: {e}")
+                self._last_qr_ticket = ticket_number
+                logger.info(f"QR Code detected: {ticket_number}")
+                
+                # Show scanning indicator and turn box green
+                self.camera.set_qr_detections(bounds, success=True)
+                self.recognition_label.configure(
+                    text="● Processing check-in...",
+                    text_color=COLORS['accent']
+                )
+                
+                # Process check-in
+                self.after(100, lambda: self._process_qr_checkin(ticket_number))
+    
+    def _memo(self, key, fetch):
+        """
+        Return a lookup memoized for this pass.
+        Misses are not cached - the ticket may be booked any moment.
+        """
+        value = self._lookup_memo.get(key)
+        if value is None:
+            value = fetch()
+            if value:
+                self._lookup_memo[key] = value
+        return value
+    
+    def _invalidate_ticket_lookups(self):
+        """A ticket changed status: drop memoized lookups and the booked-ticket map."""
+        self._lookup_memo.clear()
+        self._booked_loaded_at = 0.0
+    
+    def _get_ticket_by_number(self, ticket_number: str):
+        """Get a ticket by number (memoized for this pass)."""
+        return self._memo(('ticket', ticket_number), partial(db.get_ticket_by_number, ticket_number))
+    
+    def _get_passenger(self, passenger_id: int):
+        """Get a passenger, from the lookup loaded in on_show when possible."""
+        passenger = self.passenger_lookup.get(passenger_id)
+        if passenger is None:
+            passenger = db.get_passenger_by_id(passenger_id)
+            if passenger:
+                self.passenger_lookup[passenger_id] = passenger
+        return passenger
     
     def _process_qr_checkin(self, ticket_number: str):
         """Process check-in from QR code."""
-        ticket = db.get_ticket_by_number(ticket_number)
+        ticket = self._get_ticket_by_number(ticket_number)
         
         if not ticket:
             self.recognition_label.configure(
@@ -399,23 +543,23 @@ class CheckInView(ctk.CTkFrame):
             self.after(3000, lambda: self._reset_qr_state())
             return
         
-        if ticket.status != TicketStatus.BOOKED:
+        if ticket.status != STATUS_BOOKED:
             self.recognition_label.configure(
-                text=f"● Ticket already {ticket.status.value}",
+                text=f"● Ticket already {ticket.status}",
                 text_color=COLORS['warning']
             )
             self.after(3000, lambda: self._reset_qr_state())
             return
         
         # Get passenger and process check-in
-        passenger = db.get_passenger_by_id(ticket.passenger_id)
+        passenger = self._get_passenger(ticket.passenger_id)
         
         if passenger:
             self.is_processing = True
             checked_ticket = db.check_in_ticket(ticket.id)
+            self._invalidate_ticket_lookups()
             if checked_ticket:
                 sound_service.play_success()
-                esp_service.on_checkin_success() # Open gate, LED, buzzer
                 audit_service.log_checkin(checked_ticket.ticket_number, passenger.full_name, True)
                 self._show_boarding_pass(passenger, checked_ticket)
             self.after(5000, self._reset_recognition)
@@ -423,6 +567,7 @@ class CheckInView(ctk.CTkFrame):
     def _reset_qr_state(self):
         """Reset QR scanning state."""
         self._last_qr_ticket = None
+        self._last_frame_hash = None
         self.camera.set_qr_detections(None, success=False)
         self.recognition_label.configure(
             text="● Hold QR code in front of camera",
@@ -444,34 +589,50 @@ class CheckInView(ctk.CTkFrame):
                 text_color=COLORS['success']
             )
             
-            # Find booked ticket for this passenger
-            tickets = db.get_tickets_by_passenger(passenger_id)
-            booked_ticket = None
+            # Find and check in the booked ticket for this passenger
+            checked_ticket = self._check_in_booked_ticket(passenger_id)
             
-            for ticket in tickets:
-                if ticket.status == TicketStatus.BOOKED:
-                    booked_ticket = ticket
-                    break
-            
-            if not booked_ticket:
+            if not checked_ticket:
                 self._show_no_booking(passenger)
                 return
             
-            # Check in the ticket
-            checked_ticket = db.check_in_ticket(booked_ticket.id)
-            
-            if checked_ticket:
-                sound_service.play_success()
-                esp_service.on_checkin_success(use_blue=True) # Open gate, BLUE LED, buzzer
-                audit_service.log_checkin(checked_ticket.ticket_number, passenger.full_name, True)
-                self._show_boarding_pass(passenger, checked_ticket)
+            sound_service.play_success()
+            audit_service.log_checkin(checked_ticket.ticket_number, passenger.full_name, True)
+            self._show_boarding_pass(passenger, checked_ticket, use_blue=True)
                 
         finally:
             # Allow new recognition after delay
             self.after(5000, self._reset_recognition)
     
-    def _show_boarding_pass(self, passenger, ticket):
-        """Display boarding pass and trigger announcements."""
+    def _check_in_booked_ticket(self, passenger_id: int):
+        """
+        Check in the passenger's booked ticket from the booked-ticket map.
+        The map may be stale (booked since, or cancelled / checked in
+        elsewhere): on a miss or a failed check-in it is reloaded once and
+        the lookup retried. Returns the checked-in ticket or None.
+        """
+        fresh = monotonic() - self._booked_loaded_at > _BOOKED_TTL_S
+        if fresh:
+            self._load_booked_tickets()
+        
+        while True:
+            booked_ticket = self._booked_by_pid.get(passenger_id)
+            if booked_ticket:
+                checked_ticket = db.check_in_ticket(booked_ticket.id)
+                self._invalidate_ticket_lookups()
+                if checked_ticket:
+                    return checked_ticket
+            if fresh:
+                return None
+            self._load_booked_tickets()
+            fresh = True
+    
+    def _show_boarding_pass(self, passenger, ticket, use_blue: bool = False):
+        """
+        Display boarding pass and trigger announcements.
+        This is the only place that signals the ESP32 (gate, LED, buzzer);
+        use_blue picks the blue LED used for face check-in.
+        """
         self.current_ticket = ticket
         
         # Update status
@@ -488,54 +649,17 @@ class CheckInView(ctk.CTkFrame):
         self.bp_name.configure(text=passenger.full_name)
         self.bp_route.configure(text=f"{ticket.source_airport} → {ticket.destination_airport}")
         
-        # Clear and add details
-        for widget in self.bp_details.winfo_children():
-            widget.destroy()
-        
-        details = [
-            ("SEAT", ticket.seat_number, True),
-            ("GATE", ticket.gate, True),
-            ("TIME", ticket.flight_time.strftime("%H:%M"), False),
-            ("DATE", str(ticket.flight_date), False),
-        ]
-        
-        for label, value, highlight in details:
-            item = ctk.CTkFrame(self.bp_details, fg_color="transparent")
-            item.pack(side="left", padx=SPACING['md'])
-            
-            ctk.CTkLabel(
-                item,
-                text=label,
-                font=FONTS['caption'],
-                text_color=COLORS['text_muted']
-            ).pack()
-            
-            ctk.CTkLabel(
-                item,
-                text=value,
-                font=FONTS['subheading'] if highlight else FONTS['body'],
-                text_color=COLORS['accent'] if highlight else COLORS['text_primary']
-            ).pack()
-        
-        # Show print button
-        self.print_btn.pack(fill="x", pady=SPACING['md'])
-        
-        # Generate PDF
-        self.current_pdf_path = boarding_pass_service.generate(
-            ticket_number=ticket.ticket_number,
-            passenger_name=passenger.full_name,
-            source_airport=ticket.source_airport,
-            source_city=ticket.source_airport_name.split(' ')[0] if ticket.source_airport_name else "",
-            destination_airport=ticket.destination_airport,
-            destination_city=ticket.destination_airport_name.split(' ')[0] if ticket.destination_airport_name else "",
-            flight_date=str(ticket.flight_date),
-            flight_time=ticket.flight_time.strftime("%H:%M"),
-            seat=ticket.seat_number,
-            gate=ticket.gate,
-            passport_number=""
+        # Fill in the detail cells
+        details = (
+            ticket.seat_number,
+            ticket.gate,
+            ticket.flight_time.strftime("%H:%M"),
+            str(ticket.flight_date),
         )
+        for value_label, value in zip(self.bp_detail_values, details):
+            value_label.configure(text=value)
         
-        # Voice announcement
+        # Voice announcement (runs on its own thread)
         voice_service.announce_boarding(
             passenger_name=passenger.full_name,
             seat=ticket.seat_number,
@@ -545,10 +669,45 @@ class CheckInView(ctk.CTkFrame):
         
         # ESP32 signal
         if esp_service.is_connected:
-            esp_service.on_checkin_success()
+            self._app.run_in_background(partial(esp_service.on_checkin_success, use_blue=use_blue))
             self.esp_status.configure(text="✓ Gate signal sent")
         else:
             self.esp_status.configure(text="ESP32 not connected")
+        
+        # Show print button (enabled once the PDF is ready)
+        self.current_pdf_path = None
+        self.print_btn.configure(state="disabled", text="Preparing boarding pass...")
+        self.print_btn.pack(fill="x", pady=SPACING['md'])
+        
+        # Generate PDF off the UI thread, alongside the announcement
+        self._app.run_in_background(
+            partial(
+                boarding_pass_service.generate,
+                ticket_number=ticket.ticket_number,
+                passenger_name=passenger.full_name,
+                source_airport=ticket.source_airport,
+                source_city=ticket.source_airport_name.split(' ')[0] if ticket.source_airport_name else "",
+                destination_airport=ticket.destination_airport,
+                destination_city=ticket.destination_airport_name.split(' ')[0] if ticket.destination_airport_name else "",
+                flight_date=str(ticket.flight_date),
+                flight_time=ticket.flight_time.strftime("%H:%M"),
+                seat=ticket.seat_number,
+                gate=ticket.gate,
+                passport_number=""
+            ),
+            on_done=partial(self._on_pdf_ready, ticket)
+        )
+    
+    def _on_pdf_ready(self, ticket, pdf_path):
+        """Enable printing once the boarding pass PDF is generated."""
+        if self.current_ticket is not ticket:
+            return  # UI was reset or another passenger checked in meanwhile
+        
+        self.current_pdf_path = pdf_path
+        if pdf_path:
+            self.print_btn.configure(state="normal", text="🖨 Print Boarding Pass")
+        else:
+            self.print_btn.configure(text="Boarding pass unavailable")
     
     def _show_no_booking(self, passenger):
         """Show message when no booking found."""
@@ -571,6 +730,7 @@ class CheckInView(ctk.CTkFrame):
     
     def _reset_ui(self):
         """Reset the UI to initial state."""
+        self._lookup_memo.clear()
         self.status_icon_label.configure(text="👤")
         self.status_message.configure(
             text="Waiting for\nface recognition...",
@@ -594,7 +754,7 @@ class CheckInView(ctk.CTkFrame):
         if not ticket_number:
             return
         
-        ticket = db.get_ticket_by_number(ticket_number)
+        ticket = self._get_ticket_by_number(ticket_number)
         
         if not ticket:
             self.status_message.configure(
@@ -603,19 +763,20 @@ class CheckInView(ctk.CTkFrame):
             )
             return
         
-        if ticket.status != TicketStatus.BOOKED:
+        if ticket.status != STATUS_BOOKED:
             self.status_message.configure(
-                text=f"Ticket already {ticket.status.value}",
+                text=f"Ticket already {ticket.status}",
                 text_color=COLORS['warning']
             )
             return
         
         # Get passenger
-        passenger = db.get_passenger_by_id(ticket.passenger_id)
+        passenger = self._get_passenger(ticket.passenger_id)
         
         if passenger:
             self.is_processing = True
             checked_ticket = db.check_in_ticket(ticket.id)
+            self._invalidate_ticket_lookups()
             if checked_ticket:
                 self._show_boarding_pass(passenger, checked_ticket)
             self.is_processing = False
@@ -629,6 +790,7 @@ class CheckInView(ctk.CTkFrame):
     def on_show(self):
         """Called when view is shown."""
         self._load_face_encodings()
+        self._load_booked_tickets()
         self._reset_ui()
         self.camera.start()
         self._last_led_state = None
@@ -639,5 +801,6 @@ class CheckInView(ctk.CTkFrame):
     
     def on_hide(self):
         """Called when view is hidden."""
+        self._cancel_recognition()
         self.camera.stop()
         voice_service.stop()
@@ -66,12 +66,13 @@ class AdminPinModal(ctk.CTkFrame):
         ).pack()
         
         # Message
-        ctk.CTkLabel(
+        self.message_label = ctk.CTkLabel(
             container,
             text=message,
             font=FONTS['body'],
             text_color=COLORS['text_secondary']
-        ).pack(pady=SPACING['lg'])
+        )
+        self.message_label.pack(pady=SPACING['lg'])
         
         # PIN display
         self.pin_display = ctk.CTkLabel(
@@ -121,6 +122,19 @@ class AdminPinModal(ctk.CTkFrame):
         self.error_label = ctk.CTkLabel(container, text="", font=FONTS['body_small'], text_color=COLORS['error'])
         self.error_label.pack(pady=SPACING['md'])
         
+    def reset(
+        self,
+        title: str = "Admin Verification",
+        message: str = "Enter admin PIN to continue:",
+        on_success: Optional[Callable] = None,
+        on_cancel: Optional[Callable] = None
+    ):
+        """Reuse this modal for a new verification instead of rebuilding it."""
+        self.on_success = on_success
+        self.on_cancel = on_cancel
+        self.message_label.configure(text=message)
+        self._clear_pin()
+        
     def _add_digit(self, digit: str):
         if len(self.entered_pin) < 4:
             self.entered_pin += digit
@@ -1,11 +1,11 @@
 """
 Airport Selector - Searchable dropdown for airport selection.
 """
-from typing import Callable, Optional, Dict, List
+from typing import Callable, Optional, List
 import customtkinter as ctk
 
 from gui.theme import COLORS, FONTS, RADIUS, SPACING
-from services.airport_service import airport_service
+from services.airport_service import Airport, airport_service
 
 
 class AirportSelector(ctk.CTkFrame):
@@ -24,8 +24,8 @@ class AirportSelector(ctk.CTkFrame):
         super().__init__(parent, fg_color="transparent", **kwargs)
         
         self.on_select = on_select
-        self.selected_airport: Optional[Dict] = None
-        self.search_results: List[Dict] = []
+        self.selected_airport: Optional[Airport] = None
+        self.search_results: List[Airport] = []
         self.dropdown_visible = False
         
         self._setup_ui(label, placeholder)
@@ -146,7 +146,7 @@ class AirportSelector(ctk.CTkFrame):
             self.dropdown_frame.pack_forget()
             self.dropdown_visible = False
     
-    def _select_airport(self, airport: Dict):
+    def _select_airport(self, airport: Airport):
         """Handle airport selection."""
         self.selected_airport = airport
         
@@ -186,11 +186,11 @@ class AirportSelector(ctk.CTkFrame):
         # Delay hiding to allow click on dropdown items
         self.after(200, self._hide_dropdown)
     
-    def get_selected(self) -> Optional[Dict]:
+    def get_selected(self) -> Optional[Airport]:
         """Get the selected airport."""
         return self.selected_airport
     
-    def set_airport(self, airport: Dict):
+    def set_airport(self, airport: Airport):
         """Programmatically set the selected airport."""
         self._select_airport(airport)
     
@@ -40,8 +40,12 @@ class CameraWidget(ctk.CTkFrame):
         self.is_running = False
         self.current_frame = None
         self.detected_faces: List[Dict] = []
+        self.frame_seq = 0  # Frames read so far; passed to on_face_detected
         self._stable_face_frames = 0
         self._capture_thread: Optional[threading.Thread] = None
+        self._frame_image: Optional[ctk.CTkImage] = None  # Reused for every displayed frame
+        self._status: Optional[tuple] = None  # (text, color) currently shown
+        self._face_count: Optional[int] = None
         
         # QR Mode attributes
         self.qr_mode = False
@@ -100,7 +104,7 @@ class CameraWidget(ctk.CTkFrame):
             self.is_running = True
             self._stable_face_frames = 0
             
-            self.status_label.configure(text="● Camera Active", text_color=COLORS['success'])
+            self._set_status("● Camera Active", COLORS['success'])
             
             self._capture_loop()
             
@@ -115,12 +119,17 @@ class CameraWidget(ctk.CTkFrame):
             self.camera.release()
             self.camera = None
         
+        # Drop the last frame buffers; a stopped widget shouldn't pin them
+        self.current_frame = None
+        self.detected_faces = []
+        
         # Only update UI if widgets still exist (prevents TclError on destroyed widgets)
         try:
             if self.winfo_exists() and self.status_label.winfo_exists():
-                self.status_label.configure(text="● Camera Off", text_color=COLORS['text_secondary'])
+                self._set_status("● Camera Off", COLORS['text_secondary'])
             if self.winfo_exists() and self.display_label.winfo_exists():
                 self.display_label.configure(image=None, text="Camera Stopped")
+            self._frame_image = None
         except Exception:
             pass  # Widget was already destroyed
     
@@ -133,14 +142,20 @@ class CameraWidget(ctk.CTkFrame):
             ret, frame = self.camera.read()
             
             if ret:
-                self.current_frame = frame.copy()
+                self.frame_seq += 1
+                # read() returns a fresh array every call and overlays are drawn
+                # on copies, so the frame can be shared with consumers as is
+                self.current_frame = frame
                 
                 # Detect faces
                 self.detected_faces = face_service.detect_faces(frame)
                 
-                # Update face count display
+                # Update face count display (only when it changes - every
+                # configure redraws the label's canvas)
                 face_count = len(self.detected_faces)
-                self.face_count_label.configure(text=f"Faces: {face_count}")
+                if face_count != self._face_count:
+                    self._face_count = face_count
+                    self.face_count_label.configure(text=f"Faces: {face_count}")
                 
                 # Draw QR box if in QR mode
                 if self.qr_mode:
@@ -164,6 +179,10 @@ class CameraWidget(ctk.CTkFrame):
                     text_size = cv2.getTextSize(text, font, 0.6, 2)[0]
                     tx = (self.cam_width - text_size[0]) // 2
                     cv2.putText(display_frame, text, (tx, y - 15), font, 0.6, color, 2)
+                    
+                    # The callback scans QR codes in this mode - call it every frame
+                    if self.on_face_detected:
+                        self.on_face_detected(self.detected_faces, self.frame_seq)
                 
                 # Draw face boxes if detection enabled and not in QR mode
                 elif self.detected_faces:
@@ -175,7 +194,7 @@ class CameraWidget(ctk.CTkFrame):
                     
                     # Callback for face detection
                     if self.on_face_detected:
-                        self.on_face_detected(self.detected_faces)
+                        self.on_face_detected(self.detected_faces, self.frame_seq)
                     
                     # Auto-capture logic
                     if self.auto_capture and len(self.detected_faces) == 1:
@@ -186,29 +205,20 @@ class CameraWidget(ctk.CTkFrame):
                             # Show countdown
                             remaining = self.auto_capture_delay - self._stable_face_frames
                             if remaining > 0:
-                                self.status_label.configure(
-                                    text=f"● Hold still... {remaining // 10 + 1}s",
-                                    text_color=COLORS['warning']
-                                )
+                                self._set_status(f"● Hold still... {remaining // 10 + 1}s", COLORS['warning'])
                             
                             if self._stable_face_frames >= self.auto_capture_delay:
                                 self._trigger_capture()
                         else:
                             self._stable_face_frames = 0
-                            self.status_label.configure(
-                                text="● Center your face",
-                                text_color=COLORS['accent']
-                            )
+                            self._set_status("● Center your face", COLORS['accent'])
                     else:
                         self._stable_face_frames = 0
                 else:
                     display_frame = frame
                     self._stable_face_frames = 0
                     if self.auto_capture and not self.qr_mode:
-                        self.status_label.configure(
-                            text="● Looking for face...",
-                            text_color=COLORS['warning']
-                        )
+                        self._set_status("● Looking for face...", COLORS['warning'])
                 
                 # Display frame
                 self._display_frame(display_frame)
@@ -227,38 +237,46 @@ class CameraWidget(ctk.CTkFrame):
         # Convert BGR to RGB
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         
-        # Resize to fit
-        rgb_frame = cv2.resize(rgb_frame, (self.cam_width, self.cam_height))
+        # Resize to fit (the camera usually delivers the requested size already)
+        if rgb_frame.shape[1] != self.cam_width or rgb_frame.shape[0] != self.cam_height:
+            rgb_frame = cv2.resize(rgb_frame, (self.cam_width, self.cam_height))
         
         # Convert to PIL Image
         pil_image = Image.fromarray(rgb_frame)
         
-        # Convert to CTk Image
-        ctk_image = ctk.CTkImage(
-            light_image=pil_image,
-            dark_image=pil_image,
-            size=(self.cam_width, self.cam_height)
-        )
-        
-        # Update label
-        self.display_label.configure(image=ctk_image, text="")
-        self.display_label.image = ctk_image  # Keep reference
+        # One CTkImage per feed: later frames swap its source image, which
+        # redraws the label without a new CTkImage + label reconfigure
+        if self._frame_image is None:
+            self._frame_image = ctk.CTkImage(
+                light_image=pil_image,
+                dark_image=pil_image,
+                size=(self.cam_width, self.cam_height)
+            )
+            self.display_label.configure(image=self._frame_image, text="")
+        else:
+            self._frame_image.configure(light_image=pil_image, dark_image=pil_image)
+    
+    def _set_status(self, text: str, color: str):
+        """Update the status line, skipping the redraw if nothing changed."""
+        if self._status == (text, color):
+            return
+        self._status = (text, color)
+        self.status_label.configure(text=text, text_color=color)
     
     def _trigger_capture(self):
         """Trigger a face capture."""
         if self.current_frame is not None and self.on_face_captured:
-            self.status_label.configure(
-                text="● Face Captured!",
-                text_color=COLORS['success']
-            )
-            self.on_face_captured(self.current_frame.copy())
+            self._set_status("● Face Captured!", COLORS['success'])
+            self.on_face_captured(self.current_frame)
             self._stable_face_frames = 0
     
     def capture_now(self) -> Optional:
-        """Manually capture current frame."""
-        if self.current_frame is not None:
-            return self.current_frame.copy()
-        return None
+        """
+        Manually capture current frame.
+        The frame is shared, not copied (the next read replaces it rather
+        than overwriting it) - consumers must treat it as read-only.
+        """
+        return self.current_frame
     
     def _show_error(self, message: str):
         """Display error message."""
@@ -266,10 +284,7 @@ class CameraWidget(ctk.CTkFrame):
             text=message,
             text_color=COLORS['error']
         )
-        self.status_label.configure(
-            text="● Error",
-            text_color=COLORS['error']
-        )
+        self._set_status("● Error", COLORS['error'])
     
     def get_current_faces(self) -> List[Dict]:
         """Get currently detected faces."""
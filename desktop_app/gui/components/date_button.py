@@ -0,0 +1,94 @@
+"""
+Date Button - Touch-friendly date field with an on-demand calendar popup.
+"""
+import tkinter as tk
+from datetime import date
+from typing import Optional
+import customtkinter as ctk
+from gui.theme import COLORS, FONTS, field_button_style
+
+
+class DateButton(ctk.CTkButton):
+    """
+    Shows the selected date as button text.
+    The tkcalendar popup (a Toplevel plus dozens of ttk widgets) is only
+    built the first time the button is tapped, then reused.
+    """
+
+    def __init__(self, parent, value: date, mindate: Optional[date] = None, **kwargs):
+        super().__init__(
+            parent,
+            text=value.isoformat(),
+            command=self._toggle_popup,
+            **field_button_style(**kwargs)
+        )
+
+        self._date = value
+        self._mindate = mindate
+        self._popup: Optional[tk.Toplevel] = None
+        self._calendar = None
+
+    def get_date(self) -> date:
+        """Return the selected date."""
+        return self._date
+
+    def set_date(self, value: date):
+        """Select a date."""
+        self._date = value
+        self.configure(text=value.isoformat())
+        if self._calendar is not None:
+            self._calendar.selection_set(value)
+
+    def set_mindate(self, value: Optional[date]):
+        """Set the earliest selectable date."""
+        self._mindate = value
+        if self._calendar is not None:
+            self._calendar.configure(mindate=value)
+
+    def _build_popup(self):
+        """Create the calendar popup (first open only)."""
+        from tkcalendar import Calendar
+
+        self._popup = tk.Toplevel(self)
+        self._popup.withdraw()
+        self._popup.overrideredirect(True)
+        self._popup.bind("<Escape>", lambda e: self._popup.withdraw())
+
+        self._calendar = Calendar(
+            self._popup,
+            selectmode='day',
+            year=self._date.year,
+            month=self._date.month,
+            day=self._date.day,
+            mindate=self._mindate,
+            date_pattern='yyyy-mm-dd',
+            font=FONTS['body_large'],
+            background=COLORS['bg_secondary'],
+            foreground='white',
+            borderwidth=0,
+            headersbackground=COLORS['bg_card'],
+            headersforeground='white',
+            selectbackground=COLORS['accent'],
+            selectforeground='black'
+        )
+        self._calendar.pack()
+        self._calendar.bind("<<CalendarSelected>>", self._on_pick)
+
+    def _toggle_popup(self):
+        """Open the calendar below the button, or close it if open."""
+        if self._popup is None:
+            self._build_popup()
+        elif self._popup.winfo_viewable():
+            self._popup.withdraw()
+            return
+
+        self._calendar.selection_set(self._date)
+        self._popup.geometry(f"+{self.winfo_rootx()}+{self.winfo_rooty() + self.winfo_height()}")
+        self._popup.deiconify()
+        self._popup.lift()
+        self._calendar.focus_set()
+
+    def _on_pick(self, event=None):
+        """Apply the date picked in the calendar and close it."""
+        self.set_date(self._calendar.selection_get())
+        self._popup.withdraw()
@@ -45,28 +45,30 @@ class ModalConfirm(ctk.CTkFrame):
         ctk.CTkLabel(container, text="⚠️", font=("Segoe UI", 60)).pack(pady=(0, SPACING['md']))
         
         # Title
-        ctk.CTkLabel(
+        self.title_label = ctk.CTkLabel(
             container,
             text=title,
             font=FONTS['subheading'],
             text_color=COLORS['text_primary']
-        ).pack()
+        )
+        self.title_label.pack()
         
         # Message
-        ctk.CTkLabel(
+        self.message_label = ctk.CTkLabel(
             container,
             text=message,
             font=FONTS['body'],
             text_color=COLORS['text_secondary'],
             justify="center",
             wraplength=500
-        ).pack(pady=SPACING['xl'])
+        )
+        self.message_label.pack(pady=SPACING['xl'])
         
         # Buttons
         btn_frame = ctk.CTkFrame(container, fg_color="transparent")
         btn_frame.pack()
         
-        ctk.CTkButton(
+        self.cancel_btn = ctk.CTkButton(
             btn_frame,
             text=cancel_text,
             font=FONTS['button'],
@@ -76,9 +78,10 @@ class ModalConfirm(ctk.CTkFrame):
             height=55,
             corner_radius=RADIUS['lg'],
             command=self._handle_cancel
-        ).pack(side="left", padx=SPACING['md'])
+        )
+        self.cancel_btn.pack(side="left", padx=SPACING['md'])
         
-        ctk.CTkButton(
+        self.confirm_btn = ctk.CTkButton(
             btn_frame,
             text=confirm_text,
             font=FONTS['button'],
@@ -87,7 +90,26 @@ class ModalConfirm(ctk.CTkFrame):
             height=55,
             corner_radius=RADIUS['lg'],
             command=self._handle_confirm
-        ).pack(side="right", padx=SPACING['md'])
+        )
+        self.confirm_btn.pack(side="right", padx=SPACING['md'])
+    
+    def reset(
+        self,
+        title: str = "Are you sure?",
+        message: str = "",
+        confirm_text: str = "Confirm",
+        cancel_text: str = "Cancel",
+        confirm_color: Optional[str] = None,
+        on_confirm: Optional[Callable] = None,
+        on_cancel: Optional[Callable] = None
+    ):
+        """Reuse this modal for a new confirmation instead of rebuilding it."""
+        self.on_confirm = on_confirm
+        self.on_cancel = on_cancel
+        self.title_label.configure(text=title)
+        self.message_label.configure(text=message)
+        self.cancel_btn.configure(text=cancel_text)
+        self.confirm_btn.configure(text=confirm_text, fg_color=confirm_color or COLORS['accent'])
         
     def _handle_confirm(self):
         # Hide overlay FIRST, then call callback so chained overlays work
@@ -6,19 +6,29 @@ import customtkinter as ctk
 from typing import List, Callable, Optional
 from gui.theme import COLORS, FONTS, RADIUS, SPACING
 
+# Rows created per page; more are added only when asked for
+PAGE_SIZE = 20
+
+# (query, offset, limit) -> matching items; query is stripped and lowercased
+ItemsProvider = Callable[[str, int, int], List[str]]
+
+
 class ModalSelector(ctk.CTkFrame):
     """
     An integrated, touch-friendly selection component.
+    Takes either a plain items list or an items_provider that is queried
+    one page at a time, so large lists never become widgets all at once.
     """
     
     def __init__(
         self,
         parent,
-        items: List[str],
+        items: Optional[List[str]] = None,
         title: str = "Select Option",
         current_value: Optional[str] = None,
         on_select: Optional[Callable[[str], None]] = None,
-        on_close: Optional[Callable[[], None]] = None
+        on_close: Optional[Callable[[], None]] = None,
+        items_provider: Optional[ItemsProvider] = None
     ):
         # We take up 90% of the screen width and height for a premium overlay look
         super().__init__(
@@ -32,10 +42,14 @@ class ModalSelector(ctk.CTkFrame):
         )
         self.pack_propagate(False)
         
-        self.items = items
+        self.items = items or []
+        self.items_provider = items_provider or self._filter_items
         self.current_value = current_value
         self.on_select = on_select
         self.on_close = on_close
+        self._query = ""
+        self._offset = 0
+        self._more_btn = None
         
         self._setup_ui(title)
         
@@ -45,12 +59,13 @@ class ModalSelector(ctk.CTkFrame):
         top_bar = ctk.CTkFrame(self, fg_color="transparent", height=80)
         top_bar.pack(fill="x", padx=SPACING['xl'], pady=SPACING['lg'])
         
-        ctk.CTkLabel(
+        self.title_label = ctk.CTkLabel(
             top_bar,
             text=title,
             font=FONTS['heading'],
             text_color=COLORS['accent']
-        ).pack(side="left")
+        )
+        self.title_label.pack(side="left")
         
         ctk.CTkButton(
             top_bar,
@@ -90,17 +105,73 @@ class ModalSelector(ctk.CTkFrame):
         )
         self.scroll.pack(fill="both", expand=True, padx=SPACING['xl'], pady=(0, SPACING['xl']))
         
-        self._render_items(self.items)
+        self._show_results("")
         
-    def _render_items(self, items: List[str]):
-        """Render the list of items (limited to 50 for performance)."""
+    def reset(
+        self,
+        items: Optional[List[str]] = None,
+        title: str = "Select Option",
+        current_value: Optional[str] = None,
+        on_select: Optional[Callable[[str], None]] = None,
+        on_close: Optional[Callable[[], None]] = None,
+        items_provider: Optional[ItemsProvider] = None
+    ):
+        """Reuse this selector for a new pick instead of rebuilding it."""
+        self.items = items or []
+        self.items_provider = items_provider or self._filter_items
+        self.current_value = current_value
+        self.on_select = on_select
+        self.on_close = on_close
+        self.title_label.configure(text=title)
+        
+        # Clearing the search fires the debounced trace; render right away instead
+        self.search_var.set("")
+        if hasattr(self, '_search_job'):
+            self.after_cancel(self._search_job)
+        self._show_results("")
+        self.search_entry.focus_set()
+    
+    def _filter_items(self, query: str, offset: int, limit: int) -> List[str]:
+        """Default provider: substring filter over the plain items list."""
+        matches = [i for i in self.items if query in i.lower()] if query else self.items
+        return matches[offset:offset + limit]
+    
+    def _show_results(self, query: str):
+        """Replace the list with the first page of results for a query."""
         for widget in self.scroll.winfo_children():
             widget.destroy()
+        self._more_btn = None
+        self._query = query
+        self._offset = 0
+        self._load_page()
+    
+    def _load_page(self):
+        """Append the next page of results (one extra row tells if more exist)."""
+        rows = self.items_provider(self._query, self._offset, PAGE_SIZE + 1)
+        has_more = len(rows) > PAGE_SIZE
+        self._offset += PAGE_SIZE
+        
+        if self._more_btn is not None:
+            self._more_btn.destroy()
+            self._more_btn = None
+        
+        self._render_items(rows[:PAGE_SIZE])
         
-        # Limit to 50 items for fast rendering
-        display_items = items[:50]
+        if has_more:
+            self._more_btn = ctk.CTkButton(
+                self.scroll,
+                text="Show more... (or type to filter)",
+                font=FONTS['caption'],
+                fg_color="transparent",
+                hover_color=COLORS['bg_hover'],
+                text_color=COLORS['text_muted'],
+                command=self._load_page
+            )
+            self._more_btn.pack(pady=SPACING['sm'])
         
-        for item in display_items:
+    def _render_items(self, items: List[str]):
+        """Append a button for each item."""
+        for item in items:
             is_selected = item == self.current_value
             
             bg_color = COLORS['accent'] if is_selected else COLORS['bg_card']
@@ -120,15 +191,6 @@ class ModalSelector(ctk.CTkFrame):
                 command=lambda val=item: self._on_item_click(val)
             )
             btn.pack(fill="x", pady=2, padx=SPACING['xs'])
-        
-        # Show count if limited
-        if len(items) > 50:
-            ctk.CTkLabel(
-                self.scroll,
-                text=f"+ {len(items) - 50} more... (type to filter)",
-                font=FONTS['caption'],
-                text_color=COLORS['text_muted']
-            ).pack(pady=SPACING['sm'])
 
     def _on_search(self, *args):
         # Debounce search with 100ms delay
@@ -137,9 +199,7 @@ class ModalSelector(ctk.CTkFrame):
         self._search_job = self.after(100, self._do_search)
     
     def _do_search(self):
-        query = self.search_var.get().lower()
-        filtered = [i for i in self.items if query in i.lower()]
-        self._render_items(filtered)
+        self._show_results(self.search_var.get().strip().lower())
         
     def _on_item_click(self, value: str):
         if self.on_select:
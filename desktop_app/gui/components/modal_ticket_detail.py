@@ -5,7 +5,7 @@ Designed for the new Integrated Overlay system.
 import customtkinter as ctk
 from typing import Callable, Optional, Dict
 from gui.theme import COLORS, FONTS, RADIUS, SPACING
-from database.models import Ticket, TicketStatus
+from database.models import Ticket, STATUS_BOOKED, STATUS_CHECKED_IN, STATUS_CANCELLED
 
 class ModalTicketDetail(ctk.CTkFrame):
     """Integrated Modal for displaying ticket details."""
@@ -40,6 +40,28 @@ class ModalTicketDetail(ctk.CTkFrame):
         
         self._setup_ui(passenger_name, passenger_passport)
         
+    def reset(
+        self,
+        ticket: Ticket,
+        passenger_name: str,
+        passenger_passport: str,
+        on_reset: Optional[Callable] = None,
+        on_delete: Optional[Callable] = None,
+        on_print: Optional[Callable] = None,
+        on_close: Optional[Callable] = None
+    ):
+        """Reuse this modal for another ticket (the frame itself is kept)."""
+        self.ticket = ticket
+        self.on_reset = on_reset
+        self.on_delete = on_delete
+        self.on_print = on_print
+        self.on_close = on_close
+        
+        # Layout depends on the ticket (route names, reset button), so rebuild the contents
+        for widget in self.winfo_children():
+            widget.destroy()
+        self._setup_ui(passenger_name, passenger_passport)
+        
     def _setup_ui(self, passenger_name: str, passenger_passport: str):
         """Setup the modal UI."""
         # Main container
@@ -65,12 +87,12 @@ class ModalTicketDetail(ctk.CTkFrame):
         
         # Status
         status_color = {
-            TicketStatus.BOOKED: COLORS['warning'],
-            TicketStatus.CHECKED_IN: COLORS['success'],
-            TicketStatus.CANCELLED: COLORS['error']
+            STATUS_BOOKED: COLORS['warning'],
+            STATUS_CHECKED_IN: COLORS['success'],
+            STATUS_CANCELLED: COLORS['error']
         }.get(self.ticket.status, COLORS['text_muted'])
         
-        ctk.CTkLabel(container, text=f"● {self.ticket.status.value.upper().replace('_', ' ')}", font=FONTS['body'], text_color=status_color).pack(pady=(SPACING['xs'], SPACING['xl']))
+        ctk.CTkLabel(container, text=f"● {self.ticket.status.upper().replace('_', ' ')}", font=FONTS['body'], text_color=status_color).pack(pady=(SPACING['xs'], SPACING['xl']))
         
         # Route
         route_frame = ctk.CTkFrame(container, fg_color=COLORS['bg_card'], corner_radius=RADIUS['xl'], border_width=1, border_color=COLORS['border'])
@@ -113,7 +135,7 @@ class ModalTicketDetail(ctk.CTkFrame):
         btn_frame = ctk.CTkFrame(container, fg_color="transparent")
         btn_frame.pack(fill="x", pady=(SPACING['xl'], 0))
         
-        if self.ticket.status == TicketStatus.CHECKED_IN:
+        if self.ticket.status == STATUS_CHECKED_IN:
             ctk.CTkButton(btn_frame, text="🔄 Reset Status", font=FONTS['button'], fg_color=COLORS['warning'], hover_color="#cc8800", text_color=COLORS['bg_primary'], height=55, width=200, corner_radius=RADIUS['lg'], command=self.on_reset).pack(side="left", padx=SPACING['sm'])
             
         ctk.CTkButton(btn_frame, text="🖨️ Print Ticket", font=FONTS['button'], fg_color=COLORS['accent'], height=55, width=200, corner_radius=RADIUS['lg'], command=self.on_print).pack(side="left", padx=SPACING['sm'])
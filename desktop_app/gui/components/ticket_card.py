@@ -5,7 +5,7 @@ from typing import Callable, Optional
 import customtkinter as ctk
 
 from gui.theme import COLORS, FONTS, RADIUS, SPACING
-from database.models import Ticket, TicketStatus
+from database.models import Ticket, STATUS_BOOKED, STATUS_CHECKED_IN, STATUS_CANCELLED
 
 
 class TicketCard(ctk.CTkFrame):
@@ -14,9 +14,9 @@ class TicketCard(ctk.CTkFrame):
     """
     
     STATUS_COLORS = {
-        TicketStatus.BOOKED: COLORS['warning'],
-        TicketStatus.CHECKED_IN: COLORS['success'],
-        TicketStatus.CANCELLED: COLORS['error'],
+        STATUS_BOOKED: COLORS['warning'],
+        STATUS_CHECKED_IN: COLORS['success'],
+        STATUS_CANCELLED: COLORS['error'],
     }
     
     def __init__(
@@ -85,7 +85,7 @@ class TicketCard(ctk.CTkFrame):
         
         # Status badge
         status_color = self.STATUS_COLORS.get(self.ticket.status, COLORS['text_muted'])
-        status_text = self.ticket.status.value.upper().replace('_', ' ')
+        status_text = self.ticket.status.upper().replace('_', ' ')
         
         ctk.CTkLabel(
             header,
@@ -171,7 +171,7 @@ class TicketCard(ctk.CTkFrame):
             ).pack(anchor="w", pady=(SPACING['sm'], 0))
         
         # Action buttons
-        if self.show_actions and self.ticket.status == TicketStatus.BOOKED:
+        if self.show_actions and self.ticket.status == STATUS_BOOKED:
             actions = ctk.CTkFrame(self.content, fg_color="transparent")
             actions.pack(fill="x", pady=(SPACING['md'], 0))
             
@@ -7,12 +7,13 @@ from typing import Dict, List
 import customtkinter as ctk
 
 from gui.theme import COLORS, FONTS, RADIUS, SPACING
+from gui.base_view import BaseView
 from database.db_manager import db
-from database.models import TicketStatus
+from database.models import STATUS_BOOKED, STATUS_CHECKED_IN, STATUS_CANCELLED
 from services.audit_service import audit_service
 
 
-class DashboardView(ctk.CTkFrame):
+class DashboardView(BaseView):
     """
     Analytics dashboard showing kiosk statistics.
     """
@@ -184,9 +185,9 @@ class DashboardView(ctk.CTkFrame):
         
         # Overall stats
         total = len(tickets)
-        booked = sum(1 for t in tickets if t.status == TicketStatus.BOOKED)
-        checked = sum(1 for t in tickets if t.status == TicketStatus.CHECKED_IN)
-        cancelled = sum(1 for t in tickets if t.status == TicketStatus.CANCELLED)
+        booked = sum(1 for t in tickets if t.status == STATUS_BOOKED)
+        checked = sum(1 for t in tickets if t.status == STATUS_CHECKED_IN)
+        cancelled = sum(1 for t in tickets if t.status == STATUS_CANCELLED)
         
         self.stat_cards['total'].value_label.configure(text=str(total))
         self.stat_cards['booked'].value_label.configure(text=str(booked))
@@ -215,7 +216,7 @@ class DashboardView(ctk.CTkFrame):
         
         # Calculate metrics
         total = len(tickets)
-        checked = sum(1 for t in tickets if t.status == TicketStatus.CHECKED_IN)
+        checked = sum(1 for t in tickets if t.status == STATUS_CHECKED_IN)
         check_rate = (checked / total * 100) if total > 0 else 0
         
         # Get most popular routes
@@ -322,10 +323,10 @@ class DashboardView(ctk.CTkFrame):
                     text_color=COLORS['text_secondary']
                 ).pack(side="left", padx=SPACING['sm'])
     
+    def cache_key(self):
+        """State signature; stats only need recomputing when it changes."""
+        return (db.data_version, audit_service.entry_count, datetime.now().date())
+    
     def on_show(self):
         """Called when view is shown."""
         self._refresh_stats()
-    
-    def on_hide(self):
-        """Called when view is hidden."""
-        pass
@@ -6,17 +6,18 @@ from typing import Optional, List
 import customtkinter as ctk
 
 from gui.theme import COLORS, FONTS, RADIUS, SPACING
+from gui.base_view import BaseView
 from gui.components.ticket_card import TicketCard
 from gui.components.admin_modal import AdminPinModal
 from gui.components.modal_confirm import ModalConfirm
 from gui.components.modal_ticket_detail import ModalTicketDetail
 from database.db_manager import db
-from database.models import Ticket, TicketStatus
+from database.models import Ticket, STATUS_BOOKED, STATUS_CHECKED_IN, STATUS_CANCELLED
 from services.audit_service import audit_service
 from services.boarding_pass_service import boarding_pass_service
 
 
-class HistoryView(ctk.CTkFrame):
+class HistoryView(BaseView):
     """
     Ticket history and management view.
     Displays all tickets with filtering and action capabilities.
@@ -156,9 +157,9 @@ class HistoryView(ctk.CTkFrame):
     def _update_stats(self):
         """Update statistics display."""
         total = len(self.tickets)
-        booked = sum(1 for t in self.tickets if t.status == TicketStatus.BOOKED)
-        checked = sum(1 for t in self.tickets if t.status == TicketStatus.CHECKED_IN)
-        cancelled = sum(1 for t in self.tickets if t.status == TicketStatus.CANCELLED)
+        booked = sum(1 for t in self.tickets if t.status == STATUS_BOOKED)
+        checked = sum(1 for t in self.tickets if t.status == STATUS_CHECKED_IN)
+        cancelled = sum(1 for t in self.tickets if t.status == STATUS_CANCELLED)
         
         self.stats_labels['total'].configure(text=str(total))
         self.stats_labels['booked'].configure(text=str(booked))
@@ -186,13 +187,10 @@ class HistoryView(ctk.CTkFrame):
         
         # Display tickets
         for ticket in filtered:
-            passenger = db.get_passenger_by_id(ticket.passenger_id)
-            passenger_name = passenger.full_name if passenger else "Unknown"
-            
             card = TicketCard(
                 self.tickets_scroll,
                 ticket=ticket,
-                passenger_name=passenger_name,
+                passenger_name=ticket.passenger_name or "Unknown",
                 on_click=self._on_ticket_click,
                 on_cancel=self._on_cancel_ticket,
                 show_actions=True
@@ -204,11 +202,11 @@ class HistoryView(ctk.CTkFrame):
         if self.current_filter == "all":
             return self.tickets
         elif self.current_filter == "booked":
-            return [t for t in self.tickets if t.status == TicketStatus.BOOKED]
+            return [t for t in self.tickets if t.status == STATUS_BOOKED]
         elif self.current_filter == "checked_in":
-            return [t for t in self.tickets if t.status == TicketStatus.CHECKED_IN]
+            return [t for t in self.tickets if t.status == STATUS_CHECKED_IN]
         elif self.current_filter == "cancelled":
-            return [t for t in self.tickets if t.status == TicketStatus.CANCELLED]
+            return [t for t in self.tickets if t.status == STATUS_CANCELLED]
         return self.tickets
     
     def _on_ticket_click(self, ticket: Ticket):
@@ -300,10 +298,10 @@ class HistoryView(ctk.CTkFrame):
             on_close=app.hide_overlay
         )
     
+    def cache_key(self):
+        """State signature; the ticket list only needs reloading when it changes."""
+        return db.data_version
+    
     def on_show(self):
         """Called when view is shown."""
         self._load_tickets()
-    
-    def on_hide(self):
-        """Called when view is hidden."""
-        pass
@@ -7,13 +7,14 @@ from typing import Optional, Callable
 import logging
 
 from gui.theme import COLORS, FONTS, SPACING, RADIUS
+from gui.base_view import BaseView
 from services.stats_service import stats_service
 from services.esp_service import esp_service
 
 logger = logging.getLogger(__name__)
 
 
-class StatsView(ctk.CTkFrame):
+class StatsView(BaseView):
     """Statistics dashboard with charts and metrics."""
     
     def __init__(self, parent, show_overlay_callback: Optional[Callable] = None):
@@ -98,6 +98,12 @@ HIGH_CONTRAST_COLORS = {
     'border_light': '#cccccc',    # Light gray borders
 }
 
+_PALETTES = {
+    "dark": DARK_COLORS,
+    "light": LIGHT_COLORS,
+    "high_contrast": HIGH_CONTRAST_COLORS,
+}
+
 # Active colors (defaults to dark)
 COLORS = DARK_COLORS.copy()
 
@@ -114,6 +120,20 @@ FONTS = {
     'code': ('Consolas', 12),
 }
 
+# Pristine copy of the defaults (FONTS itself is mutated by set_large_text)
+_DEFAULT_FONTS = dict(FONTS)
+
+# Fixed-size display fonts (not affected by large text mode); shared
+# CTkFont objects are created from these by init_fonts()
+DISPLAY_FONT_SPECS = {
+    'title': ('Segoe UI Display', 32, 'bold'),
+    'title_small': ('Segoe UI Display', 28, 'bold'),
+    'ticket_number': ('Segoe UI', 36, 'bold'),
+    'step_number': ('Segoe UI', 16, 'bold'),
+    'icon_large': ('Segoe UI', 80),
+}
+DISPLAY_FONTS = {}
+
 # Large font configuration for accessibility
 LARGE_FONTS = {
     'heading_large': ('Segoe UI Display', 52, 'bold'),
@@ -179,20 +199,14 @@ def set_theme_mode(mode: str):
     """Set the theme mode and update COLORS."""
     global _current_mode, COLORS
     
-    if mode not in ("dark", "light", "high_contrast"):
+    if mode not in _PALETTES:
         mode = "dark"
     
     _current_mode = mode
     
-    if mode == "dark":
-        COLORS.clear()
-        COLORS.update(DARK_COLORS)
-    elif mode == "light":
-        COLORS.clear()
-        COLORS.update(LIGHT_COLORS)
-    elif mode == "high_contrast":
-        COLORS.clear()
-        COLORS.update(HIGH_CONTRAST_COLORS)
+    # COLORS is updated in place: every module holds a reference to this dict
+    COLORS.clear()
+    COLORS.update(_PALETTES[mode])
 
 
 def toggle_theme() -> str:
@@ -208,6 +222,12 @@ def apply_theme(ctk):
     ctk.set_default_color_theme("blue")
 
 
+def init_fonts(ctk):
+    """Create the shared display font objects (needs the root window)."""
+    for key, (family, size, *style) in DISPLAY_FONT_SPECS.items():
+        DISPLAY_FONTS[key] = ctk.CTkFont(family=family, size=size, weight=style[0] if style else "normal")
+
+
 def is_accessibility_mode() -> bool:
     """Check if accessibility mode is enabled."""
     return _accessibility_mode
@@ -240,19 +260,8 @@ def set_large_text(enabled: bool):
         FONTS.update(LARGE_FONTS)
     else:
         _current_fonts = FONTS
-        # Restore default fonts
         FONTS.clear()
-        FONTS.update({
-            'heading_large': ('Segoe UI Display', 40, 'bold'),
-            'heading': ('Segoe UI Display', 28, 'bold'),
-            'subheading': ('Segoe UI', 20, 'bold'),
-            'body_large': ('Segoe UI', 18),
-            'body': ('Segoe UI', 15),
-            'body_small': ('Segoe UI', 13),
-            'caption': ('Segoe UI', 11),
-            'button': ('Segoe UI', 15, 'bold'),
-            'code': ('Consolas', 12),
-        })
+        FONTS.update(_DEFAULT_FONTS)
 
 
 def get_current_fonts() -> dict:
@@ -263,3 +272,44 @@ def get_current_fonts() -> dict:
 def get_touch_target_size() -> int:
     """Get minimum touch target size for accessibility (48px recommended)."""
     return 56 if _accessibility_mode else 44
+
+
+# Shared widget styles. Built on each call so theme/font switches are
+# picked up; overrides win over the preset.
+
+def primary_button_style(**overrides) -> dict:
+    """CTkButton options for an accent call-to-action button."""
+    style = {
+        'font': FONTS['button'],
+        'fg_color': COLORS['accent'],
+        'hover_color': COLORS['accent_hover'],
+        'height': 50,
+        'corner_radius': RADIUS['lg'],
+    }
+    style.update(overrides)
+    return style
+
+
+def input_field_style(**overrides) -> dict:
+    """CTkEntry options for a large rounded touch input."""
+    style = {
+        'font': FONTS['body_large'],
+        'height': 60,
+        'fg_color': COLORS['bg_input'],
+        'border_color': COLORS['border'],
+        'border_width': 2,
+        'corner_radius': RADIUS['full'],
+    }
+    style.update(overrides)
+    return style
+
+
+def field_button_style(**overrides) -> dict:
+    """CTkButton options for a button that looks like an input field."""
+    style = input_field_style(
+        hover_color=COLORS['bg_hover'],
+        text_color=COLORS['text_primary'],
+        anchor="w"
+    )
+    style.update(overrides)
+    return style
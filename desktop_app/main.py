@@ -14,6 +14,7 @@ Run with: python main.py
 """
 import sys
 import warnings
+from importlib.util import find_spec
 from pathlib import Path
 
 # Suppress deprecation warnings from third-party packages
@@ -50,74 +51,77 @@ def main():
     app.mainloop()
 
 
+def _has_module(name: str) -> bool:
+    """Check that a module is installed without importing it."""
+    try:
+        return find_spec(name) is not None
+    except ImportError:  # Parent package missing
+        return False
+
+
 def check_dependencies():
     """Check if required dependencies are available."""
     missing = []
     
-    try:
-        import customtkinter
+    if _has_module("customtkinter"):
         print("  ✓ CustomTkinter")
-    except ImportError:
+    else:
         missing.append("customtkinter")
         print("  ✗ CustomTkinter")
     
-    try:
-        import cv2
+    if _has_module("cv2"):
         print("  ✓ OpenCV")
-    except ImportError:
+    else:
         missing.append("opencv-python")
         print("  ✗ OpenCV")
     
-    try:
-        import mediapipe
+    if _has_module("mediapipe"):
         print("  ✓ MediaPipe")
-    except ImportError:
+    else:
         print("  ⚠ MediaPipe (optional - will use OpenCV fallback)")
     
-    try:
-        import face_recognition
+    if _has_module("face_recognition"):
         print("  ✓ face_recognition")
-    except ImportError:
+    else:
         print("  ⚠ face_recognition (face recognition will not work)")
     
-    try:
-        import edge_tts
+    if _has_module("edge_tts"):
         print("  ✓ edge-tts")
-    except ImportError:
+    else:
         print("  ⚠ edge-tts (voice announcements will not work)")
     
-    try:
-        import reportlab
+    if _has_module("reportlab"):
         print("  ✓ ReportLab")
-    except ImportError:
+    else:
         print("  ⚠ ReportLab (boarding pass PDF will not work)")
     
-    try:
-        from tkcalendar import DateEntry
+    if _has_module("tkcalendar"):
         print("  ✓ tkcalendar")
-    except ImportError:
+    else:
         missing.append("tkcalendar")
         print("  ✗ tkcalendar")
     
-    try:
-        import rapidfuzz
+    if _has_module("rapidfuzz"):
         print("  ✓ rapidfuzz")
-    except ImportError:
+    else:
         missing.append("rapidfuzz")
         print("  ✗ rapidfuzz")
     
-    try:
-        import paho.mqtt.client
+    if _has_module("paho.mqtt.client"):
         print("  ✓ paho-mqtt")
-    except ImportError:
+    else:
         print("  ⚠ paho-mqtt (MQTT ESP32 control will not work)")
     
-    try:
-        import serial
+    if _has_module("serial"):
         print("  ✓ pyserial")
-    except ImportError:
+    else:
         print("  ⚠ pyserial (Serial ESP32 control will not work)")
     
+    if _has_module("hnswlib"):
+        print("  ✓ hnswlib")
+    else:
+        print("  ⚠ hnswlib (optional - large passenger lists use a linear scan)")
+    
     if missing:
         print(f"\n[!] Missing required dependencies: {', '.join(missing)}")
         print("    Install with: pip install " + " ".join(missing))
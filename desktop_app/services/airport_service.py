@@ -2,20 +2,43 @@
 Airport Service - Provides airport data and fuzzy search functionality.
 """
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from rapidfuzz import fuzz, process
 
 from config import ASSETS_DIR
 
 
+class Airport:
+    """One airport record (slotted: compact rows with direct attribute access)."""
+    
+    __slots__ = ('name', 'city', 'country', 'iata', 'display')
+    
+    def __init__(self, name: str, city: str, country: str, iata: str):
+        self.name = name
+        self.city = city
+        self.country = country
+        self.iata = iata
+        self.display = f"{city} ({iata}) - {name}"  # Selector label (also its lookup key)
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Return the JSON form of this airport."""
+        return {'name': self.name, 'city': self.city, 'country': self.country, 'iata': self.iata}
+
+
 class AirportService:
     """Manages airport data with fuzzy search capabilities."""
     
     def __init__(self):
         """Initialize airport service and load data."""
-        self.airports: List[Dict] = []
-        self.airports_by_code: Dict[str, Dict] = {}
+        self.airports: List[Airport] = []
+        self.airports_by_code: Dict[str, Airport] = {}
+        self.airports_by_country: Dict[str, List[Airport]] = {}
+        self._search_strings: List[str] = []
+        self._option_ngrams: Dict[str, Tuple[int, ...]] = {}  # 1-3 char substring -> sorted option indexes
+        self.options: List[str] = []  # Selector labels, aligned with self.airports
+        self.options_map: Dict[str, Airport] = {}  # Selector label -> airport
         self._load_airports()
     
     def _load_airports(self):
@@ -24,24 +47,52 @@ class AirportService:
         
         if airports_file.exists():
             with open(airports_file, 'r', encoding='utf-8') as f:
-                self.airports = json.load(f)
+                records = json.load(f)
+            self.airports = [Airport(**record) for record in records]
         else:
             # Use built-in major airports if file doesn't exist
-            self.airports = self._get_default_airports()
+            self.airports = [Airport(**record) for record in self._get_default_airports()]
             # Save for future use
             self._save_airports()
         
-        # Build lookup by IATA code
+        # Build lookups by IATA code and country
         for airport in self.airports:
-            if airport.get('iata'):
-                self.airports_by_code[airport['iata']] = airport
+            if airport.iata:
+                self.airports_by_code[airport.iata] = airport
+            self.airports_by_country.setdefault(airport.country.lower(), []).append(airport)
+        
+        # Searchable strings, aligned with self.airports (built once, not per search)
+        self._search_strings = [
+            f"{a.name} {a.city} {a.country} {a.iata}"
+            for a in self.airports
+        ]
+        
+        # Selector labels (formatted once, by Airport) for every view that lists airports
+        self.options_map = {a.display: a for a in self.airports}
+        self.options = list(self.options_map)
+        self._options_lower = [o.lower() for o in self.options]
+        
+        # Every 1-3 character substring of each label, so a search is a few
+        # dict lookups instead of a scan over all labels. Labels are visited
+        # in order, so each posting list comes out sorted; they are frozen
+        # into flat tuples (a fraction of a set's footprint, no per-query sort)
+        postings: Dict[str, List[int]] = {}
+        for idx, lowered in enumerate(self._options_lower):
+            seen = {
+                lowered[start:start + size]
+                for size in (1, 2, 3)
+                for start in range(len(lowered) - size + 1)
+            }
+            for gram in seen:
+                postings.setdefault(gram, []).append(idx)
+        self._option_ngrams = {gram: tuple(ids) for gram, ids in postings.items()}
     
     def _save_airports(self):
         """Save airports to JSON file."""
         airports_file = ASSETS_DIR / "airports.json"
         ASSETS_DIR.mkdir(parents=True, exist_ok=True)
         with open(airports_file, 'w', encoding='utf-8') as f:
-            json.dump(self.airports, f, indent=2, ensure_ascii=False)
+            json.dump([a.to_dict() for a in self.airports], f, indent=2, ensure_ascii=False)
     
     def _get_default_airports(self) -> List[Dict]:
         """Return a comprehensive list of default airports."""
@@ -156,7 +207,7 @@ class AirportService:
             {"name": "Auckland Airport", "city": "Auckland", "country": "New Zealand", "iata": "AKL"},
         ]
     
-    def search(self, query: str, limit: int = 10) -> List[Dict]:
+    def search(self, query: str, limit: int = 10) -> List[Airport]:
         """
         Search airports by name, city, country, or IATA code.
         Uses fuzzy matching for best results.
@@ -164,49 +215,80 @@ class AirportService:
         if not query or len(query) < 2:
             return []
         
-        query = query.strip().lower()
+        # Airport data is static, so results are memoized per normalized query
+        return list(self._search_cached(query.strip().lower(), limit))
+    
+    @lru_cache(maxsize=512)
+    def _search_cached(self, query: str, limit: int) -> Tuple[Airport, ...]:
+        """Fuzzy search for an already-normalized query (memoized)."""
+        matched_airports = []
         
-        # Create searchable strings for each airport
-        searchable = []
-        for airport in self.airports:
-            search_str = f"{airport['name']} {airport['city']} {airport['country']} {airport['iata']}"
-            searchable.append((search_str, airport))
+        # An exact IATA code goes straight to the top via the dict lookup
+        exact = self.airports_by_code.get(query.upper()) if len(query) == 3 else None
+        if exact:
+            matched_airports.append(exact)
         
         # Use rapidfuzz to find best matches
         results = process.extract(
             query,
-            [s[0] for s in searchable],
+            self._search_strings,
             scorer=fuzz.WRatio,
             limit=limit
         )
         
         # Map back to airport objects
-        matched_airports = []
         for match_str, score, idx in results:
-            if score >= 50:  # Minimum match threshold
-                matched_airports.append(searchable[idx][1])
+            airport = self.airports[idx]
+            if score >= 50 and airport is not exact:  # Minimum match threshold
+                matched_airports.append(airport)
+        
+        del matched_airports[limit:]
+        return tuple(matched_airports)
+    
+    def search_options(self, query: str, offset: int = 0, limit: int = 20) -> List[str]:
+        """
+        Page through selector labels containing query (already lowercased).
+        An empty query pages through all airports.
+        """
+        if not query:
+            return self.options[offset:offset + limit]
         
-        return matched_airports
+        return [self.options[i] for i in self._match_option_ids(query)[offset:offset + limit]]
     
-    def get_by_iata(self, iata_code: str) -> Optional[Dict]:
+    @lru_cache(maxsize=256)
+    def _match_option_ids(self, query: str) -> Tuple[int, ...]:
+        """Indexes of labels containing query, in list order (memoized for paging)."""
+        if len(query) <= 3:
+            return self._option_ngrams.get(query, ())
+        
+        # Candidates must contain every trigram of the query; confirm the
+        # full substring only on that (small) intersection
+        trigrams = sorted(
+            (self._option_ngrams.get(query[i:i + 3], ()) for i in range(len(query) - 2)),
+            key=len
+        )
+        candidates = set(trigrams[0]).intersection(*trigrams[1:])
+        return tuple(i for i in sorted(candidates) if query in self._options_lower[i])
+    
+    def get_by_iata(self, iata_code: str) -> Optional[Airport]:
         """Get airport by IATA code."""
         return self.airports_by_code.get(iata_code.upper())
     
-    def get_airports_by_country(self, country: str) -> List[Dict]:
+    def get_airports_by_country(self, country: str) -> List[Airport]:
         """Get all airports in a country."""
-        country_lower = country.lower()
-        return [
-            a for a in self.airports 
-            if a['country'].lower() == country_lower
-        ]
+        return list(self.airports_by_country.get(country.lower(), []))
     
-    def format_airport_display(self, airport: Dict) -> str:
+    def format_airport_display(self, airport: Airport) -> str:
         """Format airport for display in dropdown."""
-        return f"{airport['city']}, {airport['country']} ({airport['iata']}) - {airport['name']}"
+        return f"{airport.city}, {airport.country} ({airport.iata}) - {airport.name}"
+    
+    def format_airport_option(self, airport: Airport) -> str:
+        """Format airport for the selector list (also its lookup key)."""
+        return airport.display
     
-    def format_airport_short(self, airport: Dict) -> str:
+    def format_airport_short(self, airport: Airport) -> str:
         """Format airport for short display."""
-        return f"{airport['city']} ({airport['iata']})"
+        return f"{airport.city} ({airport.iata})"
 
 
 # Global airport service instance
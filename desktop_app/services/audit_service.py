@@ -15,6 +15,7 @@ class AuditService:
     def __init__(self):
         """Initialize the audit logger."""
         self.log_file = DATA_DIR / "audit.log"
+        self.entry_count = 0  # Entries logged by this process
         self._setup_logger()
     
     def _setup_logger(self):
@@ -40,6 +41,7 @@ class AuditService:
         """Log an action."""
         message = f"{action.upper():15} | {user:15} | {details}"
         self.logger.info(message)
+        self.entry_count += 1
     
     def log_booking(self, ticket_number: str, passenger: str, route: str):
         """Log a new booking."""
@@ -2,10 +2,12 @@
 Boarding Pass Service - Generates printable boarding passes as PDFs.
 Uses ReportLab for professional PDF generation.
 """
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
+import hashlib
 import io
+import json
+import os
 
 try:
     from reportlab.lib.pagesizes import A4, landscape
@@ -64,26 +66,32 @@ class BoardingPassService:
             print("Warning: ReportLab not available")
             return None
         
-        # Create output filename
-        filename = f"boarding_pass_{ticket_number}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        output_path = BOARDING_PASSES_DIR / filename
+        fields = dict(
+            ticket_number=ticket_number,
+            passenger_name=passenger_name,
+            source_airport=source_airport,
+            source_city=source_city,
+            destination_airport=destination_airport,
+            destination_city=destination_city,
+            flight_date=flight_date,
+            flight_time=flight_time,
+            seat=seat,
+            gate=gate,
+            passport_number=passport_number
+        )
         
-        # Create PDF
+        # The PDF is fully determined by its fields: name it after a digest
+        # of them and reuse the file when the same pass is requested again
+        digest = hashlib.sha1(json.dumps(fields, sort_keys=True).encode()).hexdigest()[:12]
+        output_path = BOARDING_PASSES_DIR / f"boarding_pass_{ticket_number}_{digest}.pdf"
+        if output_path.exists():
+            return output_path
+        
+        # Create PDF (written aside and renamed, so a reader never sees half a file)
+        tmp_path = output_path.with_suffix('.tmp')
         try:
-            self._create_boarding_pass(
-                str(output_path),
-                ticket_number=ticket_number,
-                passenger_name=passenger_name,
-                source_airport=source_airport,
-                source_city=source_city,
-                destination_airport=destination_airport,
-                destination_city=destination_city,
-                flight_date=flight_date,
-                flight_time=flight_time,
-                seat=seat,
-                gate=gate,
-                passport_number=passport_number
-            )
+            self._create_boarding_pass(str(tmp_path), **fields)
+            os.replace(tmp_path, output_path)
             return output_path
         except Exception as e:
             print(f"Error generating boarding pass: {e}")
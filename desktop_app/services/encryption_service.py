@@ -44,7 +44,10 @@ class EncryptionService:
     
     def encrypt_to_file(self, data: bytes, filename: str) -> Path:
         """Encrypt data and save to file in faces directory."""
-        encrypted = self.encrypt(data)
+        return self.write_encrypted_file(self.encrypt(data), filename)
+    
+    def write_encrypted_file(self, encrypted: bytes, filename: str) -> Path:
+        """Save already-encrypted data to a file in faces directory."""
         filepath = FACES_DIR / f"{filename}.enc"
         with open(filepath, 'wb') as f:
             f.write(encrypted)
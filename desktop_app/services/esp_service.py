@@ -29,6 +29,9 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# Minimum spacing between LED writes; states flickering faster are coalesced
+LED_MIN_INTERVAL_S = 0.15
+
 
 class ESPCommand(Enum):
     """Commands that can be sent to ESP32."""
@@ -43,6 +46,10 @@ class ESPCommand(Enum):
     STATUS = "STATUS"
 
 
+# One-shot blink sequences on the firmware side; they end with the LED off
+_LED_SEQUENCES = (ESPCommand.LED_GREEN, ESPCommand.LED_RED)
+
+
 class ESPService:
     """Manages ESP32 communication via MQTT or Serial."""
     
@@ -59,6 +66,16 @@ class ESPService:
         self._monitor_thread: Optional[threading.Thread] = None
         self._stop_monitor = threading.Event()
         
+        # LED changes go through one writer thread that sends only the latest
+        # wanted state, and only if it differs from what the LEDs already show
+        self._led_wanted: Optional[ESPCommand] = None
+        self._led_sent: Optional[ESPCommand] = None
+        self._led_event = threading.Event()
+        # Serial writes come from the Tk thread, the worker pool and the LED writer
+        self._serial_lock = threading.Lock()
+        self._led_writer = threading.Thread(target=self._run_led_writer, name="esp-led", daemon=True)
+        self._led_writer.start()
+        
         # Start background monitoring
         self._start_monitoring()
 
@@ -114,6 +131,7 @@ class ESPService:
     def _notify_connection_change(self, is_connected: bool):
         """Notify all listeners of connection change."""
         self.is_connected = is_connected
+        self._led_sent = None  # A (re)connected device shows an unknown state
         for callback in self._connection_callbacks:
             try:
                 callback(is_connected)
@@ -255,7 +273,8 @@ class ESPService:
             return False
         
         try:
-            self.serial_conn.write(f"{command}\n".encode('utf-8'))
+            with self._serial_lock:
+                self.serial_conn.write(f"{command}\n".encode('utf-8'))
             return True
         except Exception as e:
             print(f"Serial send error: {e}")
@@ -285,25 +304,53 @@ class ESPService:
         
         return False
     
+    def _set_led(self, command: ESPCommand) -> bool:
+        """Request an LED state; the writer thread sends it (debounced)."""
+        if not self.is_connected:
+            return False
+        self._led_wanted = command
+        self._led_event.set()
+        return True
+    
+    def _run_led_writer(self):
+        """Writer loop: send the latest wanted LED state, at most every LED_MIN_INTERVAL_S."""
+        last_write = 0.0
+        while True:
+            self._led_event.wait()
+            
+            # Let a flickering state settle - whatever is wanted after the wait wins
+            wait = last_write + LED_MIN_INTERVAL_S - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._led_event.clear()
+            
+            command = self._led_wanted
+            if command is None or command == self._led_sent:
+                continue
+            if self.send_command(command):
+                # A blink sequence leaves the LED off, so a repeat must still be sent
+                self._led_sent = ESPCommand.LED_OFF if command in _LED_SEQUENCES else command
+            last_write = time.monotonic()
+    
     def open_gate(self) -> bool:
         """Open the gate."""
         return self.send_command(ESPCommand.OPEN_GATE)
     
     def led_success(self) -> bool:
         """Turn on green LED."""
-        return self.send_command(ESPCommand.LED_GREEN)
+        return self._set_led(ESPCommand.LED_GREEN)
     
     def led_error(self) -> bool:
         """Turn on red LED."""
-        return self.send_command(ESPCommand.LED_RED)
+        return self._set_led(ESPCommand.LED_RED)
     
     def led_scanning(self) -> bool:
         """Turn on blue LED (scanning)."""
-        return self.send_command(ESPCommand.LED_BLUE)
+        return self._set_led(ESPCommand.LED_BLUE)
     
     def led_off(self) -> bool:
         """Turn off LEDs."""
-        return self.send_command(ESPCommand.LED_OFF)
+        return self._set_led(ESPCommand.LED_OFF)
     
     def buzzer_success(self) -> bool:
         """Play success buzzer."""
@@ -2,6 +2,8 @@
 Face Service - Handles face detection and recognition.
 Uses MediaPipe for detection and face_recognition for encoding/matching.
 """
+import io
+import os
 import pickle
 import uuid
 from pathlib import Path
@@ -27,9 +29,28 @@ try:
 except ImportError:
     FACE_RECOGNITION_AVAILABLE = False
 
-from config import FACE_MATCH_THRESHOLD, FACES_DIR
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+from config import FACE_MATCH_THRESHOLD, FACES_DIR, FACE_CACHE_FILE
 from services.encryption_service import encryption_service
 
+# Frames wider than this are downscaled before locating faces for encoding
+ENCODING_DETECT_WIDTH = 320
+
+# From this many known encodings on, matching uses an HNSW index (hnswlib)
+# instead of a linear scan; below it the exact scan is just as fast
+ANN_MIN_ENCODINGS = 2000
+
+# Margin (fraction of the box) kept around a known face box when encoding it
+FACE_CROP_MARGIN = 0.15
+
+# Face files hold a float32 .npy payload; older ones hold a pickle
+_NPY_MAGIC = b"\x93NUMPY"
+
 
 class FaceService:
     """Manages face detection, encoding, and recognition."""
@@ -48,8 +69,11 @@ class FaceService:
                 min_detection_confidence=0.5
             )
         
-        # Cache for loaded face encodings (passenger_id -> encoding)
-        self._encoding_cache: Dict[int, np.ndarray] = {}
+        # Cache for loaded face encodings (passenger_id -> (face_file, encoding)).
+        # Face file names are unique per save, so a changed name means a re-registered face.
+        self._encoding_cache: Dict[int, Tuple[str, np.ndarray]] = {}
+        self._persistent_cache_loaded = False
+        self._cache_dirty = False
     
     def detect_faces(self, frame: np.ndarray) -> List[Dict]:
         """
@@ -125,20 +149,40 @@ class FaceService:
         
         return frame_copy
     
-    def get_face_encoding(self, frame: np.ndarray) -> Optional[np.ndarray]:
+    def get_face_encoding(
+        self, 
+        frame: np.ndarray, 
+        face_bbox: Optional[Tuple[int, int, int, int]] = None
+    ) -> Optional[np.ndarray]:
         """
         Get face encoding from a frame.
+        face_bbox is an (x, y, w, h) box from detect_faces(); when given,
+        face location is skipped and only that region is encoded.
         Returns numpy array encoding or None if no face found.
         """
         if not FACE_RECOGNITION_AVAILABLE:
             print("Warning: face_recognition not available")
             return None
         
+        if face_bbox is not None:
+            return self._encode_face_region(frame, face_bbox)
+        
         # Convert BGR to RGB
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         
-        # Get face locations and encodings
-        face_locations = face_recognition.face_locations(rgb_frame)
+        # Locate faces on a downscaled copy (HOG cost scales with pixel
+        # count), then map the boxes back so the encoding still uses the
+        # full-resolution face
+        h, w = rgb_frame.shape[:2]
+        scale = min(1.0, ENCODING_DETECT_WIDTH / w)
+        if scale < 1.0:
+            small = cv2.resize(rgb_frame, (0, 0), fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            face_locations = [
+                (int(top / scale), int(right / scale), int(bottom / scale), int(left / scale))
+                for top, right, bottom, left in face_recognition.face_locations(small)
+            ]
+        else:
+            face_locations = face_recognition.face_locations(rgb_frame)
         
         if not face_locations:
             return None
@@ -150,26 +194,59 @@ class FaceService:
             return encodings[0]
         return None
     
+    def _encode_face_region(
+        self, 
+        frame: np.ndarray, 
+        face_bbox: Tuple[int, int, int, int]
+    ) -> Optional[np.ndarray]:
+        """Encode the face at a known box, converting only the box plus a margin."""
+        x, y, w, h = (int(v) for v in face_bbox)
+        frame_h, frame_w = frame.shape[:2]
+        margin_x, margin_y = int(w * FACE_CROP_MARGIN), int(h * FACE_CROP_MARGIN)
+        x1, y1 = max(0, x - margin_x), max(0, y - margin_y)
+        x2, y2 = min(frame_w, x + w + margin_x), min(frame_h, y + h + margin_y)
+        if x2 <= x1 or y2 <= y1:
+            return None
+        
+        rgb_crop = cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2RGB)
+        
+        # (top, right, bottom, left) of the face inside the crop
+        location = (y - y1, min(x + w, x2) - x1, min(y + h, y2) - y1, x - x1)
+        encodings = face_recognition.face_encodings(rgb_crop, [location])
+        
+        if encodings:
+            return encodings[0]
+        return None
+    
+    def encrypt_face_encoding(self, encoding: np.ndarray) -> bytes:
+        """Serialize (float32 .npy, no pickle) and encrypt a face encoding (no file I/O)."""
+        buffer = io.BytesIO()
+        np.save(buffer, np.ascontiguousarray(encoding, dtype=np.float32), allow_pickle=False)
+        return encryption_service.encrypt(buffer.getvalue())
+    
     def save_face_encoding(
         self, 
         encoding: np.ndarray, 
-        passenger_id: int
+        passenger_id: int,
+        encrypted: Optional[bytes] = None
     ) -> str:
         """
         Save face encoding to encrypted file.
-        Returns the filename (relative to FACES_DIR).
+        encrypted may carry the output of encrypt_face_encoding() computed
+        ahead of time. Returns the filename (relative to FACES_DIR).
         """
-        # Serialize encoding
-        encoding_bytes = pickle.dumps(encoding)
+        if encrypted is None:
+            encrypted = self.encrypt_face_encoding(encoding)
         
         # Generate unique filename
         filename = f"face_{passenger_id}_{uuid.uuid4().hex[:8]}"
         
-        # Encrypt and save
-        filepath = encryption_service.encrypt_to_file(encoding_bytes, filename)
+        # Save
+        filepath = encryption_service.write_encrypted_file(encrypted, filename)
         
         # Update cache
-        self._encoding_cache[passenger_id] = encoding
+        self._encoding_cache[passenger_id] = (filepath.name, encoding)
+        self._cache_dirty = True
         
         return filepath.name
     
@@ -179,29 +256,89 @@ class FaceService:
         
         encrypted_data = encryption_service.decrypt_from_file(filepath)
         if encrypted_data:
-            return pickle.loads(encrypted_data)
+            if encrypted_data.startswith(_NPY_MAGIC):
+                return np.load(io.BytesIO(encrypted_data), allow_pickle=False)
+            return pickle.loads(encrypted_data)  # Saved before the .npy format
         return None
     
     def load_all_encodings(self, passengers: List) -> Dict[int, np.ndarray]:
         """
-        Load all face encodings for a list of passengers.
+        Load all face encodings for the full list of passengers.
+        Only new or re-registered faces are decrypted; the rest come from the
+        cache, which is persisted (encrypted) so the next session starts warm.
         Returns dict mapping passenger_id to encoding.
         """
+        if not self._persistent_cache_loaded:
+            self._persistent_cache_loaded = True
+            self._load_persistent_cache()
+        
         encodings = {}
         
         for passenger in passengers:
             if passenger.face_file:
                 # Check cache first
-                if passenger.id in self._encoding_cache:
-                    encodings[passenger.id] = self._encoding_cache[passenger.id]
+                cached = self._encoding_cache.get(passenger.id)
+                if cached is not None and cached[0] == passenger.face_file:
+                    encodings[passenger.id] = cached[1]
                 else:
                     encoding = self.load_face_encoding(passenger.face_file)
                     if encoding is not None:
                         encodings[passenger.id] = encoding
-                        self._encoding_cache[passenger.id] = encoding
+                        self._encoding_cache[passenger.id] = (passenger.face_file, encoding)
+                        self._cache_dirty = True
+        
+        # Drop passengers that no longer have a face on file
+        for passenger_id in self._encoding_cache.keys() - encodings.keys():
+            del self._encoding_cache[passenger_id]
+            self._cache_dirty = True
+        
+        if self._cache_dirty:
+            self._save_persistent_cache()
         
         return encodings
     
+    def _load_persistent_cache(self):
+        """Fill the encoding cache from the encrypted cache file, if any."""
+        try:
+            data = encryption_service.decrypt_from_file(FACE_CACHE_FILE)
+            if not data:
+                return
+            with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+                for passenger_id, face_file, encoding in zip(
+                    archive['ids'].tolist(), archive['files'].tolist(), archive['encodings']
+                ):
+                    self._encoding_cache.setdefault(passenger_id, (face_file, encoding))
+        except Exception as e:
+            # Unreadable (e.g. key rotated) - rebuilt from the face files
+            print(f"Ignoring face encoding cache: {e}")
+    
+    def _save_persistent_cache(self):
+        """Write the encoding cache to the encrypted cache file (write-tmp + rename)."""
+        entries = list(self._encoding_cache.items())
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            ids=np.array([passenger_id for passenger_id, _ in entries], dtype=np.int64),
+            files=np.array([face_file for _, (face_file, _) in entries], dtype=str),
+            encodings=(
+                np.stack([encoding for _, (_, encoding) in entries]).astype(np.float32)
+                if entries else np.empty((0, 128), dtype=np.float32)
+            )
+        )
+        
+        tmp_path = FACE_CACHE_FILE.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(encryption_service.encrypt(buffer.getvalue()))
+            os.replace(tmp_path, FACE_CACHE_FILE)
+            self._cache_dirty = False
+        except OSError as e:
+            print(f"Could not save face encoding cache: {e}")
+    
+    def build_encoding_matrix(self, known_encodings: Dict[int, np.ndarray]) -> 'EncodingMatrix':
+        """Pack known encodings into an EncodingMatrix for recognize_face_matrix()."""
+        return EncodingMatrix(known_encodings)
+    
     def recognize_face(
         self, 
         frame: np.ndarray, 
@@ -211,25 +348,31 @@ class FaceService:
         Recognize a face in frame against known encodings.
         Returns (passenger_id, confidence) or None if no match.
         """
-        if not FACE_RECOGNITION_AVAILABLE or not known_encodings:
+        if not known_encodings:
+            return None
+        return self.recognize_face_matrix(frame, self.build_encoding_matrix(known_encodings))
+    
+    def recognize_face_matrix(
+        self, 
+        frame: np.ndarray, 
+        matrix: 'EncodingMatrix',
+        face_bbox: Optional[Tuple[int, int, int, int]] = None
+    ) -> Optional[Tuple[int, float]]:
+        """
+        Recognize a face in frame against an EncodingMatrix from
+        build_encoding_matrix(). All distances are computed in one call.
+        face_bbox is passed on to get_face_encoding().
+        Returns (passenger_id, confidence) or None if no match.
+        """
+        if not FACE_RECOGNITION_AVAILABLE or not len(matrix):
             return None
         
         # Get encoding of face in frame
-        current_encoding = self.get_face_encoding(frame)
+        current_encoding = self.get_face_encoding(frame, face_bbox)
         if current_encoding is None:
             return None
         
-        # Compare with all known encodings
-        best_match_id = None
-        best_distance = float('inf')
-        
-        for passenger_id, known_encoding in known_encodings.items():
-            # Calculate face distance (lower = better match)
-            distance = face_recognition.face_distance([known_encoding], current_encoding)[0]
-            
-            if distance < best_distance:
-                best_distance = distance
-                best_match_id = passenger_id
+        best_match_id, best_distance = matrix.nearest(current_encoding)
         
         # Check if best match is within threshold
         if best_distance <= FACE_MATCH_THRESHOLD:
@@ -264,8 +407,67 @@ class FaceService:
         return is_centered_x and is_centered_y
     
     def clear_cache(self):
-        """Clear the encoding cache."""
+        """Clear the encoding cache (the cache file is rewritten on the next load)."""
         self._encoding_cache.clear()
+        self._cache_dirty = True
+
+
+class EncodingMatrix:
+    """
+    Known encodings as one contiguous (N, 128) int8 matrix, quantized with
+    one scale per row (4x smaller than float32), plus the passenger ids.
+    Distances stay Euclidean, so FACE_MATCH_THRESHOLD applies unchanged.
+    Large matrices are searched through an HNSW index, built on first use
+    (i.e. on the recognition worker, not the Tk thread).
+    """
+    
+    __slots__ = ('ids', 'codes', 'scales', 'norms_sq', '_ann')
+    
+    def __init__(self, known_encodings: Dict[int, np.ndarray]):
+        self.ids = np.fromiter(known_encodings.keys(), dtype=np.int64, count=len(known_encodings))
+        self._ann = None
+        if not known_encodings:
+            self.codes = np.empty((0, 128), dtype=np.int8)
+            self.scales = np.empty(0, dtype=np.float32)
+            self.norms_sq = np.empty(0, dtype=np.float32)
+            return
+        
+        matrix = np.stack(list(known_encodings.values())).astype(np.float32)
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        self.codes = np.rint(matrix / scales[:, None]).astype(np.int8)
+        self.scales = scales
+        
+        # Norms of the rows as stored (dequantized), so distances are consistent
+        dequantized = self.codes * scales[:, None]
+        self.norms_sq = np.einsum('ij,ij->i', dequantized, dequantized)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def nearest(self, encoding: np.ndarray) -> Tuple[int, float]:
+        """Return (passenger_id, distance) of the closest known encoding."""
+        query = encoding.astype(np.float32)
+        
+        if HNSWLIB_AVAILABLE and len(self.ids) >= ANN_MIN_ENCODINGS:
+            if self._ann is None:
+                self._ann = self._build_ann()
+            labels, dist_sq = self._ann.knn_query(query, k=1)
+            return int(labels[0][0]), float(np.sqrt(dist_sq[0][0]))
+        
+        # |a - b|^2 = |a|^2 + |b|^2 - 2 a.b, with a.b from the int8 rows
+        dots = (self.codes @ query) * self.scales
+        dist_sq = self.norms_sq + query @ query - 2 * dots
+        best = int(dist_sq.argmin())
+        return int(self.ids[best]), float(np.sqrt(max(dist_sq[best], 0.0)))
+    
+    def _build_ann(self):
+        """Build the HNSW index over the (dequantized) rows, labelled by passenger id."""
+        index = hnswlib.Index(space='l2', dim=self.codes.shape[1])
+        index.init_index(max_elements=len(self.ids), ef_construction=200, M=16)
+        index.add_items(self.codes * self.scales[:, None], self.ids)
+        index.set_ef(50)
+        return index
 
 
 # Global face service instance
@@ -134,82 +134,107 @@ class QRService:
         Returns:
             Decoded ticket data dict, or None if not found/invalid
         """
+        return self.detect_and_decode(image)[0]
+    
+    def detect_and_decode(self, image) -> Tuple[Optional[Dict], Optional[Tuple[int, int, int, int]]]:
+        """
+        Locate and decode a QR code in a single pass.
+        The grayscale conversion is done once and shared by OpenCV and the
+        pyzbar fallback; each detector reports data and bounds together.
+        
+        Args:
+            image: OpenCV image (numpy array)
+            
+        Returns:
+            (ticket data dict or None, (x, y, width, height) or None)
+        """
+        if not HAS_OPENCV:
+            return None, None
+        
+        # Convert to grayscale for better detection
+        if len(image.shape) == 3:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = image
+        
+        bounds = None
+        
         # Try OpenCV QR detector first (no external dependencies)
         if HAS_OPENCV_QR and self._qr_detector is not None:
-            result = self._decode_with_opencv(image)
-            if result:
-                return result
+            data, bounds = self._decode_with_opencv(gray)
+            if data:
+                return data, bounds
         
         # Fall back to pyzbar if available
         if HAS_PYZBAR:
-            result = self._decode_with_pyzbar(image)
-            if result:
-                return result
+            data, pyzbar_bounds = self._decode_with_pyzbar(gray)
+            if data:
+                return data, pyzbar_bounds
+            bounds = bounds or pyzbar_bounds
         
-        return None
+        return None, bounds
     
-    def _decode_with_opencv(self, image) -> Optional[Dict]:
-        """Decode QR using OpenCV's built-in detector."""
+    def _decode_with_opencv(self, gray) -> Tuple[Optional[Dict], Optional[Tuple[int, int, int, int]]]:
+        """Decode QR from a grayscale image using OpenCV's built-in detector."""
         try:
-            # Convert to grayscale for better detection
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = image
-            
             # Enhance contrast for better QR detection
-            gray = cv2.equalizeHist(gray)
+            equalized = cv2.equalizeHist(gray)
             
             # Detect and decode
-            data, points, _ = self._qr_detector.detectAndDecode(gray)
+            data, points, _ = self._qr_detector.detectAndDecode(equalized)
+            
+            bounds = None
+            if points is not None and len(points) > 0:
+                pts = points[0]
+                x = int(min(pts[:, 0]))
+                y = int(min(pts[:, 1]))
+                bounds = (x, y, int(max(pts[:, 0]) - x), int(max(pts[:, 1]) - y))
             
             if data:
                 try:
                     parsed = json.loads(data)
                     if parsed.get('type') == 'flight_ticket':
                         logger.info(f"OpenCV decoded QR: ticket {parsed.get('ticket')}")
-                        return parsed
+                        return parsed, bounds
                 except json.JSONDecodeError:
                     # Try parsing as simple ticket number
                     if data.startswith('TK-'):
-                        return {'type': 'flight_ticket', 'ticket': data}
+                        return {'type': 'flight_ticket', 'ticket': data}, bounds
             
-            return None
+            return None, bounds
             
         except Exception as e:
             logger.debug(f"OpenCV QR decode error: {e}")
-            return None
+            return None, None
     
-    def _decode_with_pyzbar(self, image) -> Optional[Dict]:
-        """Decode QR using pyzbar library."""
+    def _decode_with_pyzbar(self, gray) -> Tuple[Optional[Dict], Optional[Tuple[int, int, int, int]]]:
+        """Decode QR from a grayscale image using pyzbar library."""
         try:
-            # Convert to grayscale for better detection
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = image
-            
             # Decode QR codes
             decoded_objects = pyzbar.decode(gray)
             
+            bounds = None
             for obj in decoded_objects:
                 if obj.type == 'QRCODE':
+                    rect = obj.rect
+                    obj_bounds = (rect.left, rect.top, rect.width, rect.height)
+                    bounds = bounds or obj_bounds
                     try:
                         data = json.loads(obj.data.decode('utf-8'))
                         if data.get('type') == 'flight_ticket':
                             logger.info(f"pyzbar decoded QR: ticket {data.get('ticket')}")
-                            return data
+                            return data, obj_bounds
                     except json.JSONDecodeError:
                         # Try parsing as simple ticket number
                         text = obj.data.decode('utf-8')
                         if text.startswith('TK-'):
-                            return {'type': 'flight_ticket', 'ticket': text}
+                            return {'type': 'flight_ticket', 'ticket': text}, obj_bounds
             
-            return None
+            return None, bounds
             
         except Exception as e:
             logger.debug(f"pyzbar QR decode error: {e}")
-            return None
+            return None, None
     
     def get_qr_bounds(self, image) -> Optional[Tuple[int, int, int, int]]:
         """
@@ -221,39 +246,7 @@ class QRService:
         Returns:
             Tuple of (x, y, width, height) or None if no QR found
         """
-        if not HAS_OPENCV:
-            return None
-        
-        try:
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = image
-            
-            # Try OpenCV detector
-            if HAS_OPENCV_QR and self._qr_detector is not None:
-                _, points, _ = self._qr_detector.detectAndDecode(gray)
-                if points is not None and len(points) > 0:
-                    pts = points[0]
-                    x = int(min(pts[:, 0]))
-                    y = int(min(pts[:, 1]))
-                    w = int(max(pts[:, 0]) - x)
-                    h = int(max(pts[:, 1]) - y)
-                    return (x, y, w, h)
-            
-            # Try pyzbar
-            if HAS_PYZBAR:
-                decoded_objects = pyzbar.decode(gray)
-                for obj in decoded_objects:
-                    if obj.type == 'QRCODE':
-                        rect = obj.rect
-                        return (rect.left, rect.top, rect.width, rect.height)
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"Failed to get QR bounds: {e}")
-            return None
+        return self.detect_and_decode(image)[1]
     
     def is_available(self) -> Dict[str, bool]:
         """Check which QR features are available."""
@@ -2,6 +2,8 @@
 Sound Service - Audio feedback for the Flight Kiosk System.
 Uses pygame for sound playback.
 """
+import queue
+import threading
 import pygame
 import numpy as np
 from pathlib import Path
@@ -11,16 +13,29 @@ from config import SOUNDS_DIR, SOUND_ENABLED
 
 
 class SoundService:
-    """Manages audio feedback for the kiosk."""
+    """
+    Manages audio feedback for the kiosk.
+    Mixer setup and playback run on one worker thread, so callers on the
+    Tk thread only enqueue a sound name.
+    """
     
     def __init__(self):
         """Initialize the sound service."""
         self.enabled = SOUND_ENABLED
         self._initialized = False
         self._sounds = {}
+        self._queue = queue.SimpleQueue()
         
+        self._worker = threading.Thread(target=self._run, name="sound", daemon=True)
+        self._worker.start()
+    
+    def _run(self):
+        """Worker loop: set up the mixer, then play queued sounds in order."""
         self._init_pygame()
         self._generate_sounds()
+        
+        while True:
+            self._play_now(self._queue.get())
     
     def _init_pygame(self):
         """Initialize pygame mixer."""
@@ -122,8 +137,13 @@ class SoundService:
         return pygame.sndarray.make_sound(audio)
     
     def play(self, sound_name: str):
-        """Play a sound by name."""
-        if not self.enabled or not self._initialized:
+        """Play a sound by name (returns immediately)."""
+        if self.enabled:
+            self._queue.put(sound_name)
+    
+    def _play_now(self, sound_name: str):
+        """Start playback of a sound (worker thread)."""
+        if not self._initialized:
             return
         
         sound = self._sounds.get(sound_name)